@@ -18,6 +18,10 @@ RUN pip install --no-cache-dir -r requirements.txt
 # Copy application code
 COPY src ./src
 
+# Build the ahead-of-time risk kernels (optional: numba.pycc is deprecated and
+# the risk engine JIT-compiles the same kernel when the extension is missing)
+RUN python -m src.monitoring._risk_kernels || echo "AOT kernels unavailable, using JIT"
+
 # Create models directory
 RUN mkdir -p /app/models
 
@@ -8,7 +8,7 @@ import streamlit as st
 import json
 import os
 import sys
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import requests
 from datetime import datetime, timedelta
 
@@ -55,6 +55,9 @@ class FirebaseAuth:
         # Firebase Auth REST API endpoints (fallback)
         self.auth_url = f"https://identitytoolkit.googleapis.com/v1/accounts"
         
+        # Pooled HTTP session so REST calls reuse the TLS connection
+        self.http = requests.Session()
+        
         # Check if Firebase is configured
         self.is_firebase_configured = bool(self.api_key and self.project_id)
         
@@ -190,7 +193,7 @@ class FirebaseAuth:
                             "returnSecureToken": True
                         }
                         
-                        response = requests.post(url, json=payload)
+                        response = self.http.post(url, json=payload)
                         
                         if response.status_code == 200:
                             data = response.json()
@@ -356,7 +359,7 @@ class FirebaseAuth:
                             "returnSecureToken": True
                         }
                         
-                        response = requests.post(url, json=payload)
+                        response = self.http.post(url, json=payload)
                         
                         if response.status_code == 200:
                             data = response.json()
@@ -425,7 +428,7 @@ class FirebaseAuth:
                 "returnSecureToken": True
             }
             
-            response = requests.post(url, json=payload)
+            response = self.http.post(url, json=payload)
             return response.status_code == 200
         except:
             return False
@@ -460,7 +463,7 @@ class FirebaseAuth:
                 "refresh_token": refresh_token
             }
             
-            response = requests.post(url, json=payload)
+            response = self.http.post(url, json=payload)
             
             if response.status_code == 200:
                 data = response.json()
@@ -504,7 +507,7 @@ class FirebaseAuth:
             url = f"{self.auth_url}:lookup?key={self.api_key}"
             payload = {"idToken": id_token}
             
-            response = requests.post(url, json=payload)
+            response = self.http.post(url, json=payload)
             
             if response.status_code == 200:
                 data = response.json()
@@ -646,6 +649,12 @@ class FirebaseAuth:
             return False
 
 
+@st.cache_resource
+def get_auth() -> FirebaseAuth:
+    """Get the process-wide FirebaseAuth client, shared across reruns and sessions"""
+    return FirebaseAuth()
+
+
 class SessionManager:
     """
     Manage user sessions in Streamlit with database backing
@@ -719,6 +728,18 @@ class SessionManager:
         
         return True
     
+    @staticmethod
+    def get_authenticated_user() -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Check session expiry and get current user data in one step
+        
+        Returns:
+            Tuple of (session is valid, user dictionary or None)
+        """
+        if SessionManager.check_session_expiry():
+            return True, st.session_state.get('user')
+        return False, None
+    
     @staticmethod
     def has_role(role: str) -> bool:
         """
@@ -5,7 +5,7 @@ Uses Streamlit session_state for session management
 """
 import streamlit as st
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 
 # Hardcoded credentials
@@ -60,19 +60,14 @@ class SimpleAuth:
             True if user is authenticated and session is valid
         """
         # Initialize session state if not exists
-        if 'authenticated' not in st.session_state:
-            st.session_state.authenticated = False
-        if 'user' not in st.session_state:
-            st.session_state.user = None
-        if 'login_time' not in st.session_state:
-            st.session_state.login_time = None
+        SimpleAuth.init_session()
         
         # Check authentication
-        if not st.session_state.get('authenticated', False):
+        if not st.session_state.authenticated:
             return False
         
         # Check session expiry (1 hour timeout)
-        login_time = st.session_state.get('login_time')
+        login_time = st.session_state.login_time
         if login_time and datetime.now() - login_time > timedelta(hours=1):
             SimpleAuth.logout()
             return False
@@ -91,12 +86,21 @@ class SimpleAuth:
             return st.session_state.get('user')
         return None
     
+    @staticmethod
+    def get_authenticated_user() -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Check the session and get current user data in one step
+        
+        Returns:
+            Tuple of (is logged in, user dictionary or None)
+        """
+        if SimpleAuth.is_logged_in():
+            return True, st.session_state.get('user')
+        return False, None
+    
     @staticmethod
     def init_session():
         """Initialize session state variables"""
-        if 'authenticated' not in st.session_state:
-            st.session_state.authenticated = False
-        if 'user' not in st.session_state:
-            st.session_state.user = None
-        if 'login_time' not in st.session_state:
-            st.session_state.login_time = None
+        st.session_state.setdefault('authenticated', False)
+        st.session_state.setdefault('user', None)
+        st.session_state.setdefault('login_time', None)
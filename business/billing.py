@@ -3,15 +3,22 @@ Stripe Billing Integration for ASF-Engine SaaS
 Handles subscriptions, payments, and invoices
 """
 import os
-from typing import Dict, Any, Optional, List
+import time
+import uuid
+import functools
+from typing import Dict, Any, Optional, List, Tuple
 import stripe
 from datetime import datetime
 
-# Initialize Stripe
-stripe.api_key = os.getenv("STRIPE_API_KEY")
-if not stripe.api_key:
+# Stripe configuration
+STRIPE_API_KEY = os.getenv("STRIPE_API_KEY")
+if not STRIPE_API_KEY:
     raise ValueError("STRIPE_API_KEY environment variable must be set for billing features")
 
+# Subscription records kept current by Stripe webhooks, keyed by subscription ID
+SUBSCRIPTION_CACHE_TTL = 3600  # seconds
+_subscription_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
 
 class SubscriptionPlan:
     """Subscription plan definitions"""
@@ -103,8 +110,9 @@ class SubscriptionPlan:
         return [cls.FREE, cls.STARTER, cls.PROFESSIONAL, cls.ENTERPRISE]
     
     @classmethod
+    @functools.lru_cache(maxsize=16)
     def get_plan(cls, plan_id: str) -> Optional[Dict[str, Any]]:
-        """Get specific plan by ID"""
+        """Get specific plan by ID (memoized, plans are static)"""
         plans = {p["id"]: p for p in cls.get_all_plans()}
         return plans.get(plan_id)
 
@@ -112,9 +120,24 @@ class SubscriptionPlan:
 class BillingService:
     """Stripe billing service"""
     
-    def __init__(self):
-        """Initialize billing service"""
-        self.stripe = stripe
+    def __init__(self, client: Optional[stripe.StripeClient] = None):
+        """
+        Initialize billing service
+        
+        Args:
+            client: Optional preconfigured Stripe client (e.g. for tests)
+        """
+        # The client owns a pooled HTTP session and retries network errors
+        self.client = client or stripe.StripeClient(
+            api_key=STRIPE_API_KEY,
+            max_network_retries=2,
+            http_client=stripe.RequestsClient()
+        )
+    
+    @staticmethod
+    def _idempotent() -> Dict[str, Any]:
+        """Request options that make a create call safe to retry"""
+        return {"idempotency_key": uuid.uuid4().hex}
     
     def create_customer(self, email: str, name: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -129,10 +152,13 @@ class BillingService:
             Customer data
         """
         try:
-            customer = self.stripe.Customer.create(
-                email=email,
-                name=name,
-                metadata=metadata or {}
+            customer = self.client.customers.create(
+                params={
+                    "email": email,
+                    "name": name,
+                    "metadata": metadata or {}
+                },
+                options=self._idempotent()
             )
             
             return {
@@ -160,13 +186,19 @@ class BillingService:
         Returns:
             Subscription data
         """
+        params = {
+            "customer": customer_id,
+            "items": [{"price": price_id}],
+            "payment_behavior": "default_incomplete",
+            "expand": ["latest_invoice.payment_intent"]
+        }
+        if trial_days > 0:
+            params["trial_period_days"] = trial_days
+        
         try:
-            subscription = self.stripe.Subscription.create(
-                customer=customer_id,
-                items=[{"price": price_id}],
-                trial_period_days=trial_days if trial_days > 0 else None,
-                payment_behavior="default_incomplete",
-                expand=["latest_invoice.payment_intent"]
+            subscription = self.client.subscriptions.create(
+                params=params,
+                options=self._idempotent()
             )
             
             return {
@@ -178,6 +210,58 @@ class BillingService:
         except Exception as e:
             return {"error": str(e)}
     
+    def signup(
+        self,
+        email: str,
+        name: str,
+        price_id: str,
+        trial_days: int = 0,
+        success_url: str = "http://localhost:8501/success",
+        cancel_url: str = "http://localhost:8501/cancel"
+    ) -> Dict[str, Any]:
+        """
+        Start a new customer signup with a single Stripe call
+        
+        Checkout creates the customer and the subscription together when
+        the session completes, so a failed payment never leaves an orphan
+        customer behind. The resulting subscription arrives through the
+        customer.subscription.created webhook.
+        
+        Args:
+            email: Customer email
+            name: Customer name
+            price_id: Stripe price ID
+            trial_days: Number of trial days
+            success_url: Redirect URL on success
+            cancel_url: Redirect URL on cancel
+            
+        Returns:
+            Checkout session data
+        """
+        subscription_data = {"metadata": {"name": name}}
+        if trial_days > 0:
+            subscription_data["trial_period_days"] = trial_days
+        
+        try:
+            session = self.client.checkout.sessions.create(
+                params={
+                    "mode": "subscription",
+                    "line_items": [{"price": price_id, "quantity": 1}],
+                    "customer_email": email,
+                    "subscription_data": subscription_data,
+                    "success_url": success_url,
+                    "cancel_url": cancel_url
+                },
+                options=self._idempotent()
+            )
+            
+            return {
+                "session_id": session.id,
+                "url": session.url
+            }
+        except Exception as e:
+            return {"error": str(e)}
+    
     def cancel_subscription(self, subscription_id: str) -> Dict[str, Any]:
         """
         Cancel a subscription
@@ -189,7 +273,8 @@ class BillingService:
             Cancellation data
         """
         try:
-            subscription = self.stripe.Subscription.delete(subscription_id)
+            subscription = self.client.subscriptions.cancel(subscription_id)
+            _subscription_cache.pop(subscription_id, None)
             
             return {
                 "subscription_id": subscription.id,
@@ -199,28 +284,103 @@ class BillingService:
         except Exception as e:
             return {"error": str(e)}
     
-    def get_subscription(self, subscription_id: str) -> Dict[str, Any]:
+    def get_subscription(self, subscription_id: str, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get subscription details
         
+        Served from the webhook-maintained cache when possible; Stripe is
+        only queried on a cache miss, after expiry, or when forced.
+        
         Args:
             subscription_id: Stripe subscription ID
+            force_refresh: Bypass the cache and fetch from Stripe
             
         Returns:
             Subscription data
         """
+        if not force_refresh:
+            cached = _subscription_cache.get(subscription_id)
+            if cached and time.monotonic() - cached[0] < SUBSCRIPTION_CACHE_TTL:
+                return cached[1]
+        
         try:
-            subscription = self.stripe.Subscription.retrieve(subscription_id)
+            subscription = self.client.subscriptions.retrieve(subscription_id)
+            return self._cache_subscription(subscription)
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def handle_webhook(self, payload: bytes, sig_header: str) -> Dict[str, Any]:
+        """
+        Handle a Stripe webhook event
+        
+        customer.subscription.* events refresh the cached subscription
+        record, so callers never need to poll Stripe for status.
+        
+        Args:
+            payload: Raw request body
+            sig_header: Value of the Stripe-Signature header
             
-            return {
-                "subscription_id": subscription.id,
-                "status": subscription.status,
-                "current_period_start": datetime.fromtimestamp(subscription.current_period_start),
-                "current_period_end": datetime.fromtimestamp(subscription.current_period_end),
-                "cancel_at_period_end": subscription.cancel_at_period_end
-            }
+        Returns:
+            Event data
+        """
+        try:
+            event = self.client.construct_event(
+                payload, sig_header, os.getenv("STRIPE_WEBHOOK_SECRET")
+            )
         except Exception as e:
             return {"error": str(e)}
+        
+        if event.type.startswith("customer.subscription."):
+            self._cache_subscription(event.data.object)
+        
+        return {
+            "event_id": event.id,
+            "type": event.type
+        }
+    
+    def refresh_subscriptions(self, subscription_ids: Optional[List[str]] = None) -> int:
+        """
+        Re-fetch cached subscriptions from Stripe
+        
+        Meant to run periodically so cache entries are renewed in the
+        background instead of all expiring and hitting Stripe at once.
+        
+        Args:
+            subscription_ids: Subscriptions to refresh (default: all cached)
+            
+        Returns:
+            Number of subscriptions refreshed
+        """
+        if subscription_ids is None:
+            subscription_ids = list(_subscription_cache)
+        
+        refreshed = 0
+        for subscription_id in subscription_ids:
+            if "error" not in self.get_subscription(subscription_id, force_refresh=True):
+                refreshed += 1
+        
+        return refreshed
+    
+    @staticmethod
+    def _cache_subscription(subscription) -> Dict[str, Any]:
+        """Store a Stripe subscription object in the cache"""
+        data = {
+            "subscription_id": subscription.id,
+            "customer_id": subscription.customer,
+            "status": subscription.status,
+            "current_period_start": datetime.fromtimestamp(subscription.current_period_start),
+            "current_period_end": datetime.fromtimestamp(subscription.current_period_end),
+            "cancel_at_period_end": subscription.cancel_at_period_end
+        }
+        _subscription_cache[subscription.id] = (time.monotonic(), data)
+        return data
+    
+    @staticmethod
+    def _invalidate_customer(customer_id: str):
+        """Drop cached subscriptions belonging to a customer"""
+        for subscription_id, (_, data) in list(_subscription_cache.items()):
+            if data["customer_id"] == customer_id:
+                _subscription_cache.pop(subscription_id, None)
     
     def create_checkout_session(
         self,
@@ -241,13 +401,19 @@ class BillingService:
         Returns:
             Checkout session data
         """
+        params = {
+            "mode": "subscription",
+            "line_items": [{"price": price_id, "quantity": 1}],
+            "success_url": success_url,
+            "cancel_url": cancel_url
+        }
+        if customer_id:
+            params["customer"] = customer_id
+        
         try:
-            session = self.stripe.checkout.Session.create(
-                mode="subscription",
-                line_items=[{"price": price_id, "quantity": 1}],
-                success_url=success_url,
-                cancel_url=cancel_url,
-                customer=customer_id
+            session = self.client.checkout.sessions.create(
+                params=params,
+                options=self._idempotent()
             )
             
             return {
@@ -269,7 +435,9 @@ class BillingService:
             List of invoice data
         """
         try:
-            invoices = self.stripe.Invoice.list(customer=customer_id, limit=limit)
+            invoices = self.client.invoices.list(
+                params={"customer": customer_id, "limit": limit}
+            )
             
             return [
                 {
@@ -300,10 +468,15 @@ class BillingService:
         Returns:
             Portal session data
         """
+        # Subscriptions may change in the portal; re-fetch them on next read
+        self._invalidate_customer(customer_id)
+        
         try:
-            session = self.stripe.billing_portal.Session.create(
-                customer=customer_id,
-                return_url=return_url
+            session = self.client.billing_portal.sessions.create(
+                params={
+                    "customer": customer_id,
+                    "return_url": return_url
+                }
             )
             
             return {
@@ -8,6 +8,15 @@ import csv
 from typing import Dict, Any, List
 from datetime import datetime
 import io
+import gzip
+import math
+from datetime import date, time, timedelta
+from decimal import Decimal
+import numpy as np
+import xlsxwriter
+
+# Values xlsxwriter writes natively (floats are checked for NaN/inf separately)
+_EXCEL_NATIVE_TYPES = (str, bool, int, Decimal, datetime, date, time, timedelta)
 
 
 class DataExporter:
@@ -75,18 +84,57 @@ class DataExporter:
         if not data:
             return b""
         
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
+        # Column order follows first appearance across all rows
+        fieldnames = list(dict.fromkeys(key for row in data for key in row))
+        
+        excel_buffer = io.BytesIO()
+        workbook = xlsxwriter.Workbook(
+            filename or excel_buffer,
+            {
+                'constant_memory': True,
+                'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+                'remove_timezone': True
+            }
+        )
+        header_format = workbook.add_format({'bold': True, 'border': 1})
+        worksheet = workbook.add_worksheet()
+        
+        # Rows are streamed straight to the sheet without a DataFrame
+        worksheet.write_row(0, 0, fieldnames, header_format)
+        for i, row in enumerate(data, 1):
+            worksheet.write_row(i, 0, [self._excel_value(row.get(k)) for k in fieldnames])
+        
+        workbook.close()
         
-        # Export to Excel
         if filename:
-            df.to_excel(filename, index=False, engine='openpyxl')
             with open(filename, 'rb') as f:
                 return f.read()
-        else:
-            excel_buffer = io.BytesIO()
-            df.to_excel(excel_buffer, index=False, engine='openpyxl')
-            return excel_buffer.getvalue()
+        return excel_buffer.getvalue()
+    
+    @staticmethod
+    def _excel_value(value: Any) -> Any:
+        """
+        Convert a value to one xlsxwriter writes natively, as df.to_excel did
+        
+        NaN, NaT and None become blank cells, infinities are written as
+        'inf'/'-inf' and unsupported types (dicts, UUIDs, ...) as str().
+        """
+        if isinstance(value, np.datetime64):
+            value = pd.Timestamp(value)
+        elif isinstance(value, np.generic):
+            value = value.item()
+        
+        if value is None or value is pd.NaT:
+            return None
+        if isinstance(value, float):
+            if math.isnan(value):
+                return None
+            if math.isinf(value):
+                return 'inf' if value > 0 else '-inf'
+            return value
+        if isinstance(value, _EXCEL_NATIVE_TYPES):
+            return value
+        return str(value)
     
     def export_metrics(
         self,
@@ -138,30 +186,43 @@ class DataExporter:
         metrics: List[Dict[str, Any]],
         alerts: List[Dict[str, Any]],
         logs: List[Dict[str, Any]],
-        format: str = "json"
+        format: str = "json",
+        compress: bool = False
     ) -> bytes:
         """
         Create a complete export bundle with all data
         
+        Empty sections are left out of the bundle; the summary still
+        reports their counts.
+        
         Args:
             metrics: Metrics data
             alerts: Alerts data
             logs: Logs data
             format: Export format
+            compress: Whether to gzip the JSON output
             
         Returns:
             Export bundle as bytes
         """
-        bundle = {
-            "export_date": datetime.now().isoformat(),
-            "metrics": metrics,
-            "alerts": alerts,
-            "logs": logs,
-            "summary": {
-                "total_metrics": len(metrics),
-                "total_alerts": len(alerts),
-                "total_logs": len(logs)
-            }
-        }
+        bundle = {"export_date": datetime.now().isoformat()}
+        summary = {}
+        
+        for name, section in (("metrics", metrics), ("alerts", alerts), ("logs", logs)):
+            if section:
+                bundle[name] = section
+            summary[f"total_{name}"] = len(section)
+        
+        bundle["summary"] = summary
+        
+        if not compress:
+            return self.export_to_json(bundle, pretty=True)
+        
+        # Stream the encoded JSON into gzip instead of building one large string
+        buffer = io.BytesIO()
+        encoder = json.JSONEncoder(indent=2, default=str)
+        with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=1) as gz:
+            for chunk in encoder.iterencode(bundle):
+                gz.write(chunk.encode('utf-8'))
         
-        return self.export_to_json(bundle, pretty=True)
+        return buffer.getvalue()
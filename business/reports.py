@@ -9,46 +9,87 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
 import io
+import os
+import numpy as np
+
+
+# Number of alerts rendered per Paragraph in the alerts section
+ALERTS_PER_PARAGRAPH = 50
+
+# (label, metrics key, printf format, scale) for each row of the health table
+HEALTH_TABLE_ROWS = (
+    ('Accuracy', 'accuracy', '%.2f%%', 100),
+    ('Latency', 'latency_ms', '%.1f ms', 1),
+    ('Error Rate', 'error_rate', '%.2f%%', 100),
+    ('CPU Usage', 'cpu_usage', '%.1f%%', 100),
+    ('Memory Usage', 'memory_usage', '%.1f%%', 100),
+)
+
+
+def _build_styles():
+    """Build the sample stylesheet with custom paragraph styles"""
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1E88E5'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    ))
+    
+    # Subtitle style
+    styles.add(ParagraphStyle(
+        name='CustomSubtitle',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=colors.HexColor('#424242'),
+        spaceAfter=12,
+        spaceBefore=12
+    ))
+    
+    return styles
+
+
+# Stylesheet shared by all generators; it is only read after construction
+_STYLES = _build_styles()
+
+# Worker pool for CPU-bound PDF rendering, created on first use
+_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Get the process pool used for async report rendering"""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
 
 
 class ReportGenerator:
-    """Generate PDF reports for system monitoring"""
+    """Generate PDF reports for system monitoring
+    
+    Instances hold no per-report state, so a single instance can be
+    shared across threads (see REPORT_GEN).
+    """
     
     def __init__(self):
         """Initialize report generator"""
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1E88E5'),
-            spaceAfter=30,
-            alignment=TA_CENTER
-        ))
-        
-        # Subtitle style
-        self.styles.add(ParagraphStyle(
-            name='CustomSubtitle',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#424242'),
-            spaceAfter=12,
-            spaceBefore=12
-        ))
+        self.styles = _STYLES
     
     def generate_system_report(
         self,
         risk_report: Dict[str, Any],
         metrics: Dict[str, Any],
         alerts: List[Dict[str, Any]],
-        output_path: str = None
+        output_path: str = None,
+        health_values: List[str] = None
     ) -> bytes:
         """
         Generate a comprehensive system health report
@@ -58,6 +99,7 @@ class ReportGenerator:
             metrics: System metrics
             alerts: List of alerts
             output_path: Optional file path to save PDF
+            health_values: Optional pre-formatted health table values
             
         Returns:
             PDF content as bytes
@@ -85,7 +127,7 @@ class ReportGenerator:
         elements.extend(self._add_executive_summary(risk_report))
         
         # Add system health section
-        elements.extend(self._add_health_section(risk_report, metrics))
+        elements.extend(self._add_health_section(risk_report, metrics, health_values))
         
         # Add alerts section
         elements.extend(self._add_alerts_section(alerts))
@@ -110,6 +152,75 @@ class ReportGenerator:
         
         return pdf_bytes
     
+    async def generate_async(
+        self,
+        risk_report: Dict[str, Any],
+        metrics: Dict[str, Any],
+        alerts: List[Dict[str, Any]],
+        output_path: str = None
+    ) -> bytes:
+        """
+        Generate a system health report in a worker process
+        
+        Args:
+            risk_report: Risk assessment data
+            metrics: System metrics
+            alerts: List of alerts
+            output_path: Optional file path to save PDF
+            
+        Returns:
+            PDF content as bytes
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_pool(), _build_pdf, risk_report, metrics, alerts, output_path
+        )
+    
+    def generate_bulk_reports(self, inputs: List[Dict[str, Any]]) -> List[bytes]:
+        """
+        Generate system health reports for many customers at once
+        
+        Health table values for all reports are formatted in a single
+        vectorized pass before the per-report PDFs are built.
+        
+        Args:
+            inputs: List of dicts with 'risk_report', 'metrics', 'alerts'
+                and optional 'output_path' keys
+            
+        Returns:
+            List of PDF contents as bytes, in input order
+        """
+        if not inputs:
+            return []
+        
+        health_values = self._format_health_values([item['metrics'] for item in inputs])
+        
+        return [
+            self.generate_system_report(
+                item['risk_report'],
+                item['metrics'],
+                item.get('alerts', []),
+                output_path=item.get('output_path'),
+                health_values=values
+            )
+            for item, values in zip(inputs, health_values)
+        ]
+    
+    @staticmethod
+    def _format_health_values(all_metrics: List[Dict[str, Any]]) -> List[List[str]]:
+        """Format health table values for a batch of metrics dicts"""
+        values = np.array(
+            [[m.get(key, 0) for _, key, _, _ in HEALTH_TABLE_ROWS] for m in all_metrics],
+            dtype=np.float64
+        )
+        
+        columns = [
+            np.char.mod(fmt, values[:, i] * scale)
+            for i, (_, _, fmt, scale) in enumerate(HEALTH_TABLE_ROWS)
+        ]
+        
+        return np.stack(columns, axis=1).tolist()
+    
     def _add_header(self) -> List:
         """Add report header"""
         elements = []
@@ -158,7 +269,12 @@ class ReportGenerator:
         
         return elements
     
-    def _add_health_section(self, risk_report: Dict[str, Any], metrics: Dict[str, Any]) -> List:
+    def _add_health_section(
+        self,
+        risk_report: Dict[str, Any],
+        metrics: Dict[str, Any],
+        values: List[str] = None
+    ) -> List:
         """Add system health metrics section"""
         elements = []
         
@@ -166,15 +282,15 @@ class ReportGenerator:
         title = Paragraph("System Health Metrics", self.styles['CustomSubtitle'])
         elements.append(title)
         
+        if values is None:
+            values = self._format_health_values([metrics])[0]
+        
         # Create metrics table
-        data = [
-            ['Metric', 'Current Value', 'Status'],
-            ['Accuracy', f"{metrics.get('accuracy', 0):.2%}", '✓ Normal'],
-            ['Latency', f"{metrics.get('latency_ms', 0):.1f} ms", '✓ Normal'],
-            ['Error Rate', f"{metrics.get('error_rate', 0):.2%}", '✓ Normal'],
-            ['CPU Usage', f"{metrics.get('cpu_usage', 0):.1%}", '✓ Normal'],
-            ['Memory Usage', f"{metrics.get('memory_usage', 0):.1%}", '✓ Normal']
-        ]
+        data = [['Metric', 'Current Value', 'Status']]
+        data.extend(
+            [label, value, '✓ Normal']
+            for (label, _, _, _), value in zip(HEALTH_TABLE_ROWS, values)
+        )
         
         table = Table(data, colWidths=[2*inch, 2*inch, 2*inch])
         table.setStyle(TableStyle([
@@ -202,13 +318,18 @@ class ReportGenerator:
         elements.append(title)
         
         if alerts:
-            for alert in alerts[:10]:  # Limit to 10 alerts
-                alert_text = f"""
-                <b>{alert.get('severity', 'INFO').upper()}:</b> {alert.get('message', 'No message')}<br/>
-                <i>Time: {alert.get('timestamp', 'Unknown')}</i>
-                """
-                alert_para = Paragraph(alert_text, self.styles['Normal'])
-                elements.append(alert_para)
+            severities = [a.get('severity', 'INFO').upper() for a in alerts]
+            messages = [a.get('message', 'No message') for a in alerts]
+            times = [a.get('timestamp', 'Unknown') for a in alerts]
+            lines = [
+                '<b>%s:</b> %s<br/><i>Time: %s</i>' % line
+                for line in zip(severities, messages, times)
+            ]
+            
+            # Paragraphs are expensive to build, so group alerts into chunks
+            for start in range(0, len(lines), ALERTS_PER_PARAGRAPH):
+                chunk = '<br/><br/>'.join(lines[start:start + ALERTS_PER_PARAGRAPH])
+                elements.append(Paragraph(chunk, self.styles['Normal']))
                 elements.append(Spacer(1, 10))
         else:
             no_alerts = Paragraph("No active alerts - System operating normally", self.styles['Normal'])
@@ -265,3 +386,17 @@ class ReportGenerator:
         elements.append(footer)
         
         return elements
+
+
+# Process-wide report generator
+REPORT_GEN = ReportGenerator()
+
+
+def _build_pdf(
+    risk_report: Dict[str, Any],
+    metrics: Dict[str, Any],
+    alerts: List[Dict[str, Any]],
+    output_path: str = None
+) -> bytes:
+    """Render a report in a pool worker (top-level so it can be pickled)"""
+    return REPORT_GEN.generate_system_report(risk_report, metrics, alerts, output_path)
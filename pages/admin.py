@@ -5,7 +5,21 @@ Administrative interface for managing users, system, and monitoring
 import streamlit as st
 from auth.simple_auth import SimpleAuth
 from datetime import datetime
-import pandas as pd
+from typing import TYPE_CHECKING
+
+# pandas is imported inside the tab renderers so non-admin page loads never pay for it
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Column dtypes for the users table; categoricals keep repeated values compact
+USERS_SCHEMA = {
+    'Email': 'string',
+    'Name': 'string',
+    'Plan': 'category',
+    'Status': 'category',
+    'Joined': 'datetime64[ns]'
+}
 
 
 def render_admin_panel():
@@ -15,14 +29,13 @@ def render_admin_panel():
     SimpleAuth.init_session()
     
     # Check authentication
-    if not SimpleAuth.is_logged_in():
+    ok, user = SimpleAuth.get_authenticated_user()
+    if not ok:
         st.warning("⚠️ Please log in to access the admin panel")
         if st.button("Go to Login"):
             st.switch_page("pages/login.py")
         st.stop()
     
-    user = SimpleAuth.get_user()
-    
     # Check if user is admin
     if user.get('role') != 'admin':
         st.error("❌ Access Denied: Admin privileges required")
@@ -34,29 +47,30 @@ def render_admin_panel():
     st.markdown(f"Welcome, **{user['display_name']}** | Admin Dashboard")
     st.markdown("---")
     
-    # Create tabs for different admin sections
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "📊 Overview",
-        "👥 Users",
-        "🚨 System Health",
-        "💳 Billing",
-        "⚙️ Settings"
-    ])
-    
-    with tab1:
-        render_overview_tab()
-    
-    with tab2:
-        render_users_tab()
-    
-    with tab3:
-        render_system_health_tab()
-    
-    with tab4:
-        render_billing_tab()
+    # Only the selected section is rendered on each rerun
+    sections = {
+        "📊 Overview": render_overview_tab,
+        "👥 Users": render_users_tab,
+        "🚨 System Health": render_system_health_tab,
+        "💳 Billing": render_billing_tab,
+        "⚙️ Settings": render_settings_tab
+    }
     
-    with tab5:
-        render_settings_tab()
+    section = st.radio(
+        "Section",
+        list(sections.keys()),
+        horizontal=True,
+        key="admin_tab",
+        label_visibility="collapsed"
+    )
+    sections[section]()
+
+
+def _metric_row(items):
+    """Render (label, value, delta) metric tuples side by side in one row"""
+    cols = st.columns(len(items))
+    for col, metric in zip(cols, items):
+        col.metric(*metric)
 
 
 def render_overview_tab():
@@ -64,16 +78,12 @@ def render_overview_tab():
     st.markdown("### 📊 Platform Overview")
     
     # Key metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total Users", "1,247", "+23 this week")
-    with col2:
-        st.metric("Active Sessions", "89", "+12 today")
-    with col3:
-        st.metric("Total Revenue", "$12,450", "+$2,340 this month")
-    with col4:
-        st.metric("System Uptime", "99.9%", "Last 30 days")
+    _metric_row([
+        ("Total Users", "1,247", "+23 this week"),
+        ("Active Sessions", "89", "+12 today"),
+        ("Total Revenue", "$12,450", "+$2,340 this month"),
+        ("System Uptime", "99.9%", "Last 30 days")
+    ])
     
     st.markdown("---")
     
@@ -82,24 +92,39 @@ def render_overview_tab():
     
     with col1:
         st.markdown("#### User Growth")
-        # Demo chart data
-        chart_data = pd.DataFrame({
-            'Date': pd.date_range(start='2024-01-01', periods=30, freq='D'),
-            'Users': range(1000, 1300, 10)
-        })
-        st.line_chart(chart_data.set_index('Date'))
+        st.line_chart(_user_growth_df())
     
     with col2:
         st.markdown("#### Revenue Trend")
-        revenue_data = pd.DataFrame({
-            'Month': ['Jan', 'Feb', 'Mar', 'Apr', 'May'],
-            'Revenue': [8000, 9500, 10200, 11000, 12450]
-        })
-        st.bar_chart(revenue_data.set_index('Month'))
+        st.bar_chart(_revenue_df())
+
+
+@st.cache_data
+def _user_growth_df() -> "pd.DataFrame":
+    """Demo user growth chart data"""
+    import pandas as pd
+    
+    return pd.DataFrame({
+        'Date': pd.date_range(start='2024-01-01', periods=30, freq='D'),
+        'Users': range(1000, 1300, 10)
+    }).set_index('Date')
+
+
+@st.cache_data
+def _revenue_df() -> "pd.DataFrame":
+    """Demo revenue chart data"""
+    import pandas as pd
+    
+    return pd.DataFrame({
+        'Month': ['Jan', 'Feb', 'Mar', 'Apr', 'May'],
+        'Revenue': [8000, 9500, 10200, 11000, 12450]
+    }).set_index('Month')
 
 
 def render_users_tab():
     """Render users management tab"""
+    import pandas as pd
+    
     st.markdown("### 👥 User Management")
     
     # User search
@@ -111,16 +136,14 @@ def render_users_tab():
             st.info("Search functionality coming soon")
     
     # Demo users table
-    users_data = {
-        'Email': ['john@example.com', 'sarah@example.com', 'mike@example.com'],
-        'Name': ['John Doe', 'Sarah Smith', 'Mike Johnson'],
-        'Plan': ['Professional', 'Starter', 'Free'],
-        'Status': ['Active', 'Active', 'Active'],
-        'Joined': ['2024-01-15', '2024-02-10', '2024-03-01']
-    }
+    users_rows = [
+        {'Email': 'john@example.com', 'Name': 'John Doe', 'Plan': 'Professional', 'Status': 'Active', 'Joined': '2024-01-15'},
+        {'Email': 'sarah@example.com', 'Name': 'Sarah Smith', 'Plan': 'Starter', 'Status': 'Active', 'Joined': '2024-02-10'},
+        {'Email': 'mike@example.com', 'Name': 'Mike Johnson', 'Plan': 'Free', 'Status': 'Active', 'Joined': '2024-03-01'}
+    ]
     
-    users_df = pd.DataFrame(users_data)
-    st.dataframe(users_df, use_container_width=True)
+    users_df = pd.DataFrame.from_records(users_rows, columns=list(USERS_SCHEMA)).astype(USERS_SCHEMA)
+    display_large_dataframe(users_df, key="users_page")
     
     st.markdown("---")
     
@@ -141,8 +164,40 @@ def render_users_tab():
             st.info("Export functionality coming soon")
 
 
+def display_large_dataframe(df: "pd.DataFrame", page_size: int = 50, key: str = "page_num"):
+    """
+    Render a DataFrame one page at a time
+    
+    Only the selected page is sent to the browser on each rerun.
+    
+    Args:
+        df: DataFrame to display
+        page_size: Number of rows per page
+        key: Session state key holding the current page number
+    """
+    total_pages = max(1, -(-len(df) // page_size))
+    
+    st.session_state.setdefault(key, 1)
+    if st.session_state[key] > total_pages:
+        st.session_state[key] = total_pages
+    
+    if total_pages > 1:
+        st.number_input(
+            f"Page (of {total_pages})",
+            min_value=1,
+            max_value=total_pages,
+            step=1,
+            key=key
+        )
+    
+    start = (st.session_state[key] - 1) * page_size
+    st.dataframe(df.iloc[start:start + page_size], height=400, use_container_width=True)
+
+
 def render_system_health_tab():
     """Render system health tab"""
+    import pandas as pd
+    
     st.markdown("### 🚨 System Health Monitoring")
     
     # Service status
@@ -156,15 +211,16 @@ def render_system_health_tab():
         'Cache': ('healthy', '🟢')
     }
     
-    for service, (status, icon) in services.items():
-        col1, col2, col3 = st.columns([2, 1, 1])
-        with col1:
-            st.markdown(f"**{service}**")
-        with col2:
-            st.markdown(f"{icon} {status.upper()}")
-        with col3:
-            if st.button("Details", key=f"btn_{service}"):
-                st.info(f"{service} is operating normally")
+    services_df = pd.DataFrame.from_dict(services, orient='index', columns=['status', 'icon'])
+    services_df['Status'] = services_df['icon'] + ' ' + services_df['status'].str.upper()
+    st.dataframe(
+        services_df[['Status']].rename_axis('Service').reset_index(),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    selected = st.selectbox("View details for", list(services.keys()))
+    st.info(f"{selected} is operating normally")
     
     st.markdown("---")
     
@@ -188,19 +244,17 @@ def render_system_health_tab():
 
 def render_billing_tab():
     """Render billing tab"""
+    import pandas as pd
+    
     st.markdown("### 💳 Billing & Revenue")
     
     # Revenue metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("MRR", "$12,450", "+$2,340")
-    with col2:
-        st.metric("ARR", "$149,400", "+$28,080")
-    with col3:
-        st.metric("Churn Rate", "2.1%", "-0.5%")
-    with col4:
-        st.metric("ARPU", "$49.80", "+$4.20")
+    _metric_row([
+        ("MRR", "$12,450", "+$2,340"),
+        ("ARR", "$149,400", "+$28,080"),
+        ("Churn Rate", "2.1%", "-0.5%"),
+        ("ARPU", "$49.80", "+$4.20")
+    ])
     
     st.markdown("---")
     
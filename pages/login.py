@@ -6,6 +6,48 @@ import streamlit as st
 from auth.simple_auth import SimpleAuth
 
 
+# Static page styles, built once at import instead of on every rerun
+_LOGIN_CSS = """
+<style>
+.login-container {
+    max-width: 500px;
+    margin: 0 auto;
+    padding: 40px 20px;
+}
+.login-header {
+    text-align: center;
+    margin-bottom: 40px;
+}
+.login-header h1 {
+    color: #1E88E5;
+    font-size: 2.5em;
+    margin-bottom: 10px;
+}
+.login-header p {
+    color: #666;
+    font-size: 1.2em;
+}
+.stButton > button {
+    width: 100%;
+    background-color: #1E88E5;
+    color: white;
+    border-radius: 8px;
+    padding: 12px;
+    font-size: 16px;
+    font-weight: 600;
+    border: none;
+    margin-top: 10px;
+}
+.stButton > button:hover {
+    background-color: #1565C0;
+}
+.tab-content {
+    padding: 20px 0;
+}
+</style>
+"""
+
+
 def render_login_page():
     """Render the login page"""
     
@@ -20,45 +62,7 @@ def render_login_page():
         return
     
     # Custom CSS for login page
-    st.markdown("""
-    <style>
-    .login-container {
-        max-width: 500px;
-        margin: 0 auto;
-        padding: 40px 20px;
-    }
-    .login-header {
-        text-align: center;
-        margin-bottom: 40px;
-    }
-    .login-header h1 {
-        color: #1E88E5;
-        font-size: 2.5em;
-        margin-bottom: 10px;
-    }
-    .login-header p {
-        color: #666;
-        font-size: 1.2em;
-    }
-    .stButton > button {
-        width: 100%;
-        background-color: #1E88E5;
-        color: white;
-        border-radius: 8px;
-        padding: 12px;
-        font-size: 16px;
-        font-weight: 600;
-        border: none;
-        margin-top: 10px;
-    }
-    .stButton > button:hover {
-        background-color: #1565C0;
-    }
-    .tab-content {
-        padding: 20px 0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_LOGIN_CSS, unsafe_allow_html=True)
     
     # Header
     st.markdown("""
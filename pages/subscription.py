@@ -7,6 +7,46 @@ from auth.simple_auth import SimpleAuth
 from business.billing import SubscriptionPlan, BillingService
 
 
+# Maximum number of plan cards shown side by side
+PLANS_PER_ROW = 3
+
+
+@st.cache_data(ttl=3600)
+def _cached_plans():
+    """Get all subscription plans, cached across reruns"""
+    return SubscriptionPlan.get_all_plans()
+
+
+@st.cache_data
+def _plan_card_html(plan_id: str, name: str, price: int, is_current: bool) -> str:
+    """Build the HTML card for a plan, cached per plan and current state"""
+    return f"""
+            <div style='
+                border: {"3px solid #1E88E5" if is_current else "1px solid #ccc"};
+                border-radius: 10px;
+                padding: 20px;
+                margin: 10px 0;
+                background: {"#E3F2FD" if is_current else "white"};
+            '>
+                <h3 style='text-align: center; color: #1E88E5;'>{name}</h3>
+                <h2 style='text-align: center;'>
+                    {"FREE" if price == 0 else f"${price}/mo"}
+                </h2>
+            </div>
+            """
+
+
+@st.cache_data(ttl=60)
+def _usage(user_id: str) -> dict:
+    """Get plan usage as {label: (used, total, unit)}, cached per user"""
+    # Demo values until usage tracking is backed by the database
+    return {
+        "Predictions": (47, 100, ""),
+        "Storage": (70, 100, "MB"),
+        "Team Members": (1, 3, "")
+    }
+
+
 def render_subscription_page():
     """Render subscription management page"""
     
@@ -27,7 +67,7 @@ def render_subscription_page():
     st.markdown("---")
     
     # Get all plans
-    plans = SubscriptionPlan.get_all_plans()
+    plans = _cached_plans()
     
     # Display current plan
     current_plan = user.get('subscription_plan', 'free')
@@ -35,41 +75,30 @@ def render_subscription_page():
     
     st.markdown("### Available Plans")
     
-    # Display plans in columns
-    cols = st.columns(len(plans))
-    
-    for idx, plan in enumerate(plans):
-        with cols[idx]:
-            is_current = plan['id'] == current_plan
-            
-            # Plan card
-            st.markdown(f"""
-            <div style='
-                border: {"3px solid #1E88E5" if is_current else "1px solid #ccc"};
-                border-radius: 10px;
-                padding: 20px;
-                margin: 10px 0;
-                background: {"#E3F2FD" if is_current else "white"};
-            '>
-                <h3 style='text-align: center; color: #1E88E5;'>{plan['name']}</h3>
-                <h2 style='text-align: center;'>
-                    {"FREE" if plan['price'] == 0 else f"${plan['price']}/mo"}
-                </h2>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Features
-            st.markdown("**Features:**")
-            for feature in plan['features']:
-                st.markdown(f"✓ {feature}")
-            
-            # Action button
-            if is_current:
-                st.success("✓ Active Plan")
-            else:
-                if st.button(f"Upgrade to {plan['name']}", key=f"btn_{plan['id']}", use_container_width=True):
-                    st.info(f"Upgrade to {plan['name']} - Stripe integration pending")
-                    st.markdown("Contact sales@asf-engine.io for enterprise plans")
+    # Display plans in rows of at most PLANS_PER_ROW columns
+    for row_start in range(0, len(plans), PLANS_PER_ROW):
+        row = plans[row_start:row_start + PLANS_PER_ROW]
+        cols = st.columns(len(row))
+        
+        for idx, plan in enumerate(row):
+            with cols[idx]:
+                is_current = plan['id'] == current_plan
+                
+                # Plan card
+                html = _plan_card_html(plan['id'], plan['name'], plan['price'], is_current)
+                st.markdown(html, unsafe_allow_html=True)
+                
+                # Features
+                st.markdown("**Features:**")
+                st.markdown("\n".join(f"- ✓ {feature}" for feature in plan['features']))
+                
+                # Action button
+                if is_current:
+                    st.success("✓ Active Plan")
+                else:
+                    if st.button(f"Upgrade to {plan['name']}", key=f"btn_{plan['id']}", use_container_width=True):
+                        st.info(f"Upgrade to {plan['name']} - Stripe integration pending")
+                        st.markdown("Contact sales@asf-engine.io for enterprise plans")
     
     st.markdown("---")
     
@@ -106,9 +135,9 @@ def render_subscription_page():
     # Progress bars
     st.markdown("#### Plan Limits")
     
-    st.progress(0.47, text="Predictions: 47/100")
-    st.progress(0.70, text="Storage: 70MB/100MB")
-    st.progress(0.33, text="Team Members: 1/1")
+    usage = _usage(user.get('user_id'))
+    for label, (used, total, unit) in usage.items():
+        st.progress(used / total, text=f"{label}: {used}{unit}/{total}{unit}")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 """
 Email Verification Page - Not Available in Simple Auth Mode
 """
+import os
+
 import streamlit as st
 
 # Page configuration
@@ -10,24 +12,52 @@ st.set_page_config(
     layout="centered"
 )
 
+# Token verification only exists with Firebase auth; simple auth has no email step
+AUTH_MODE = os.getenv('AUTH_MODE', 'simple')
+
+_VERIFY_HEADER_HTML = """
+    <div class="verify-header">
+        <h1>✉️ Email Verification</h1>
+        <p>Verifying your email address...</p>
+    </div>
+    """
+
+_VERIFIED_HTML = """
+            <div style='text-align: center; padding: 20px;'>
+                <h2>🎉 Email Verified!</h2>
+                <p>Your email has been successfully verified. You can now access all features.</p>
+            </div>
+            """
+
+_FOOTER_HTML = """
+    <div style='text-align: center; opacity: 0.6; padding: 20px;'>
+        <p>ASF-Engine v2.0.0 - Enterprise SaaS Edition</p>
+    </div>
+    """
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _verify(token: str) -> bool:
+    """Verify an email token; reruns with the same token reuse the result"""
+    from auth.firebase_auth import get_auth
+    
+    return get_auth().verify_email_with_token(token)
+
 
 def render_verify_email_page():
     """Render the email verification page"""
     
-    st.title("✉️ Email Verification")
-    st.info("Email verification is not required in simple authentication mode.")
-    st.markdown("---")
-    
-    if st.button("Go to Login", use_container_width=True):
-        st.switch_page("pages/login.py")
+    if AUTH_MODE != 'firebase':
+        st.title("✉️ Email Verification")
+        st.info("Email verification is not required in simple authentication mode.")
+        st.markdown("---")
+        
+        if st.button("Go to Login", use_container_width=True):
+            st.switch_page("pages/login.py")
+        return
     
     # Header
-    st.markdown("""
-    <div class="verify-header">
-        <h1>✉️ Email Verification</h1>
-        <p>Verifying your email address...</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_VERIFY_HEADER_HTML, unsafe_allow_html=True)
     
     # Get token from URL parameters
     query_params = st.query_params
@@ -39,21 +69,13 @@ def render_verify_email_page():
             st.switch_page("pages/login.py")
         return
     
-    # Initialize Firebase Auth
-    auth = FirebaseAuth()
-    
     # Verify email
     with st.spinner("Verifying email..."):
-        success = auth.verify_email_with_token(token)
+        success = _verify(token)
         
         if success:
             st.balloons()
-            st.markdown("""
-            <div style='text-align: center; padding: 20px;'>
-                <h2>🎉 Email Verified!</h2>
-                <p>Your email has been successfully verified. You can now access all features.</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_VERIFIED_HTML, unsafe_allow_html=True)
             
             if st.button("✅ Go to Dashboard", use_container_width=True):
                 st.switch_page("app.py")
@@ -63,11 +85,7 @@ def render_verify_email_page():
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style='text-align: center; opacity: 0.6; padding: 20px;'>
-        <p>ASF-Engine v2.0.0 - Enterprise SaaS Edition</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
@@ -9,37 +9,77 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from backend.database import init_db, SessionLocal, create_user
-from backend.auth import get_password_hash
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 
+_BANNER = "\n".join([
+    "=" * 60,
+    "ASF-Engine Database Initialization",
+    "=" * 60,
+])
+
+_COMPLETE_MESSAGE = "\n".join([
+    "",
+    "=" * 60,
+    "✅ Database initialization complete!",
+    "=" * 60,
+    "",
+    "You can now start the application:",
+    "  Streamlit: streamlit run app.py",
+    "  Backend:   python backend/main.py",
+    "",
+])
+
+
+def _insert_for_dialect(dialect_name: str):
+    """Return the dialect-specific insert() that supports ON CONFLICT"""
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+    return insert
+
+
 def create_default_admin():
     """Create default admin user if it doesn't exist"""
+    from backend.database import SessionLocal, User
+    
     db = SessionLocal()
     
     try:
-        from backend.database import get_user_by_email
-        
-        # Check if admin exists
         admin_email = os.getenv('DEMO_EMAIL', 'admin@test.com')
-        existing_admin = get_user_by_email(db, admin_email)
         
-        if not existing_admin:
-            print(f"Creating default admin user: {admin_email}")
-            admin = create_user(
-                db,
+        # Skip the password hash (slow by design) when the admin already exists
+        if db.query(User.id).filter(User.email == admin_email).first():
+            print(f"ℹ️  Admin user already exists: {admin_email}")
+            return
+        
+        from backend.auth import get_password_hash
+        
+        hashed_password = get_password_hash(os.getenv('DEMO_PASSWORD', '1234'))
+        insert = _insert_for_dialect(db.get_bind().dialect.name)
+        
+        # Single INSERT ... ON CONFLICT DO NOTHING; no row returned means the admin exists
+        stmt = (
+            insert(User)
+            .values(
                 email=admin_email,
-                hashed_password=get_password_hash(os.getenv('DEMO_PASSWORD', '1234')),
-                full_name="Admin User"
+                hashed_password=hashed_password,
+                full_name="Admin User",
+                role="admin",
+                email_verified=True,
+                is_admin=True
             )
-            admin.role = "admin"
-            admin.email_verified = True
-            admin.is_admin = True
-            db.commit()
+            .on_conflict_do_nothing(index_elements=['email'])
+            .returning(User.id)
+        )
+        created = db.execute(stmt).first()
+        db.commit()
+        
+        if created:
             print(f"✅ Admin user created: {admin_email}")
         else:
             print(f"ℹ️  Admin user already exists: {admin_email}")
@@ -54,19 +94,22 @@ def create_default_admin():
 
 def main():
     """Main initialization function"""
-    print("=" * 60)
-    print("ASF-Engine Database Initialization")
-    print("=" * 60)
+    print(_BANNER)
     
     # Check if DATABASE_URL is set
     database_url = os.getenv('DATABASE_URL')
     if not database_url:
-        print("❌ ERROR: DATABASE_URL environment variable not set")
-        print("Please create a .env file with DATABASE_URL configured")
+        print(
+            "❌ ERROR: DATABASE_URL environment variable not set\n"
+            "Please create a .env file with DATABASE_URL configured"
+        )
         return
     
     print(f"Database URL: {database_url[:30]}...")
     
+    # Imported only now: backend.database requires DATABASE_URL and pulls in SQLAlchemy
+    from backend.database import init_db
+    
     # Initialize database
     print("\n📊 Creating database tables...")
     try:
@@ -80,13 +123,7 @@ def main():
     print("\n👤 Setting up admin user...")
     create_default_admin()
     
-    print("\n" + "=" * 60)
-    print("✅ Database initialization complete!")
-    print("=" * 60)
-    print("\nYou can now start the application:")
-    print("  Streamlit: streamlit run app.py")
-    print("  Backend:   python backend/main.py")
-    print()
+    print(_COMPLETE_MESSAGE)
 
 
 if __name__ == "__main__":
@@ -2,102 +2,366 @@
 Alert Generation System
 Generates alerts and recommendations for system issues
 """
-from typing import Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 from datetime import datetime
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+import copy
+import functools
+import hashlib
+import json
+import time
 import uuid
 
+import numpy as np
+
+from src.monitoring.risk_engine import _json_default
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Alert fields mirrored column-wise for vectorized history queries
+_HISTORY_COLUMNS = ('id', 'timestamp', 'type', 'severity')
+
+# Seconds during which an alert with the same type, severity and title is suppressed
+ALERT_COOLDOWN_S = 300
+
+# Dedup entries kept before expired ones are pruned
+_DEDUP_PRUNE_SIZE = 1024
+
+# Risk report fields that alert generation depends on
+_ALERT_REPORT_KEYS = ('failure_probability', 'health_score', 'root_causes')
+
+# (threshold, severity, title), checked in order: alert when probability > threshold
+_FAILURE_THRESHOLDS = (
+    (70, 'critical', 'Critical: High Failure Probability Detected'),
+    (40, 'warning', 'Warning: Elevated Failure Risk'),
+)
+
+# (threshold, severity, title, recommendations), checked in order: alert when score < threshold
+_HEALTH_THRESHOLDS = (
+    (50, 'critical', 'Critical: System Health Severely Degraded',
+     ('Immediate investigation required', 'Consider rollback to last stable version')),
+    (70, 'warning', 'Warning: System Health Declining',
+     ('Monitor closely', 'Review recent changes')),
+)
+
+
+# Recommendations for each root cause issue
+_CAUSE_RECOMMENDATIONS: Dict[str, Tuple[str, ...]] = {
+    'Accuracy Degradation': (
+        'Retrain model immediately',
+        'Check for data distribution changes',
+        'Review feature importance shifts',
+        'Enable A/B testing with previous model version'
+    ),
+    'High Latency': (
+        'Scale compute resources',
+        'Enable request batching',
+        'Optimize model inference',
+        'Implement response caching'
+    ),
+    'Elevated Error Rate': (
+        'Review recent deployments',
+        'Check dependency health',
+        'Increase retry policies',
+        'Enable circuit breakers'
+    ),
+    'High CPU Utilization': (
+        'Scale out worker instances',
+        'Optimize compute-intensive operations',
+        'Enable auto-scaling',
+        'Review CPU profiling data'
+    ),
+    'High Memory Utilization': (
+        'Check for memory leaks',
+        'Optimize data structures',
+        'Increase memory limits',
+        'Enable memory profiling'
+    ),
+    'Data Distribution Drift': (
+        'Retrain model on recent data',
+        'Update feature normalization',
+        'Review data sources',
+        'Implement drift detection alerts'
+    ),
+    'Cost Overrun': (
+        'Review resource utilization',
+        'Optimize instance types',
+        'Enable cost anomaly detection',
+        'Implement resource quotas'
+    )
+}
+
+
+@dataclass(slots=True)
+class Alert:
+    """
+    A single alert; supports alert['field'] reads like the dicts it replaced
+    """
+    id: str
+    timestamp: str
+    type: str
+    severity: str
+    title: str
+    description: str
+    metrics: Dict = field(default_factory=dict)
+    recommendations: List[str] = field(default_factory=list)
+    status: str = 'active'
+    acknowledged: bool = False
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+    
+    def to_dict(self) -> Dict:
+        """Convert to a plain dict for serialization"""
+        return asdict(self)
+
 
 class AlertGenerator:
     """
     Generates and manages alerts for system failures and issues
     """
     
+    # Failure-risk recommendations per root cause category
+    _CATEGORY_RECS: Dict[str, Tuple[str, ...]] = {
+        'Model Performance': (
+            'Retrain model with recent data',
+            'Enable shadow deployment for new model',
+            'Increase model validation frequency'
+        ),
+        'Performance': (
+            'Scale up infrastructure',
+            'Enable caching layer',
+            'Optimize query performance'
+        ),
+        'Data Quality': (
+            'Review data pipeline for anomalies',
+            'Implement stricter input validation',
+            'Update feature transformations'
+        ),
+        'Infrastructure': (
+            'Horizontal scaling needed',
+            'Check for resource leaks',
+            'Review auto-scaling policies'
+        )
+    }
+    
+    # Order in which category recommendations fill the top 5
+    _CATEGORY_PRIORITY = ('Model Performance', 'Performance', 'Data Quality', 'Infrastructure')
+    
     def __init__(self):
         self.alert_history = []
         self.active_alerts = []
         
+        # Active alerts indexed by ID and severity, kept in sync by create_alert
+        self._alerts_by_id = {}
+        self._by_severity = {'critical': [], 'warning': [], 'info': []}
+        self._severity_counts = Counter()
+        
+        # Last (monotonic time, alert) per type|severity|title, for cooldown dedup
+        self._dedup: Dict[str, Tuple[float, Alert]] = {}
+        
+        # Alert history as parallel columns; the DataFrame is rebuilt lazily
+        self._history_columns = {column: [] for column in _HISTORY_COLUMNS}
+        self._history_frame = None
+        
     def create_alert(self, 
                     alert_type: str,
                     severity: str,
                     title: str,
                     description: str,
                     metrics: Dict = None,
-                    recommendations: List[str] = None) -> Dict:
+                    recommendations: List[str] = None,
+                    alert_id: str = None) -> Alert:
         """
         Create a new alert
         """
-        alert = {
-            'id': str(uuid.uuid4()),
-            'timestamp': datetime.now().isoformat(),
-            'type': alert_type,
+        return self.create_alerts_batch([{
+            'alert_type': alert_type,
             'severity': severity,
             'title': title,
             'description': description,
-            'metrics': metrics or {},
-            'recommendations': recommendations or [],
-            'status': 'active',
-            'acknowledged': False
-        }
+            'metrics': metrics,
+            'recommendations': recommendations,
+            'alert_id': alert_id
+        }])[0]
+    
+    def create_alerts_batch(self, specs: List[Dict]) -> List[Alert]:
+        """
+        Create several alerts sharing one timestamp
+        
+        An alert matching the type, severity and title of one created within
+        ALERT_COOLDOWN_S is not created again; the existing alert is returned.
+        
+        Args:
+            specs: create_alert keyword arguments, one dict per alert
+            
+        Returns:
+            The created (or suppressed duplicate) alerts, in the order of specs
+        """
+        timestamp = datetime.now().isoformat()
+        now = time.monotonic()
+        id_prefix = None
+        
+        if len(self._dedup) > _DEDUP_PRUNE_SIZE:
+            self._dedup = {k: v for k, v in self._dedup.items() if now - v[0] < ALERT_COOLDOWN_S}
+        
+        results = []
+        alerts = []
+        for i, spec in enumerate(specs):
+            key = f"{spec['alert_type']}|{spec['severity']}|{spec['title']}"
+            last = self._dedup.get(key)
+            if last is not None and now - last[0] < ALERT_COOLDOWN_S:
+                results.append(last[1])
+                continue
+            
+            alert_id = spec.get('alert_id')
+            if not alert_id:
+                # One random prefix per batch, numbered per alert
+                if id_prefix is None:
+                    id_prefix = uuid.uuid4().hex
+                alert_id = f"{id_prefix}-{i}"
+            
+            alert = Alert(
+                id=alert_id,
+                timestamp=timestamp,
+                type=spec['alert_type'],
+                severity=spec['severity'],
+                title=spec['title'],
+                description=spec['description'],
+                # Specs may come from the shared _derive_alerts cache; never alias nested values
+                metrics=copy.deepcopy(spec.get('metrics') or {}),
+                recommendations=list(spec.get('recommendations') or [])
+            )
+            self._dedup[key] = (now, alert)
+            alerts.append(alert)
+            results.append(alert)
+        
+        self.alert_history.extend(alerts)
+        self.active_alerts.extend(alerts)
+        for alert in alerts:
+            self._alerts_by_id[alert.id] = alert
+            self._by_severity.setdefault(alert.severity, []).append(alert)
+        self._severity_counts.update(alert.severity for alert in alerts)
         
-        self.alert_history.append(alert)
-        self.active_alerts.append(alert)
+        if alerts:
+            for column, values in self._history_columns.items():
+                values.extend(getattr(alert, column) for alert in alerts)
+            self._history_frame = None
         
-        return alert
+        return results
     
-    def generate_alerts_from_risk_report(self, risk_report: Dict) -> List[Dict]:
+    def generate_alerts_from_risk_report(self, risk_report: Dict) -> List[Alert]:
         """
         Generate alerts based on risk report
+        
+        Alerts are derived from the report's failure probability, health
+        score and root causes only, and their IDs are a hash of those
+        fields, so an unchanged report returns the existing alerts.
         """
-        alerts = []
+        report_json = json.dumps(
+            {key: risk_report[key] for key in _ALERT_REPORT_KEYS},
+            sort_keys=True,
+            default=_json_default
+        )
         
-        # High failure probability alert
-        if risk_report['failure_probability']['overall'] > 70:
-            alert = self.create_alert(
-                alert_type='FAILURE_PREDICTION',
-                severity='critical',
-                title='Critical: High Failure Probability Detected',
-                description=f"System has {risk_report['failure_probability']['overall']}% probability of failure in next 72 hours",
-                metrics={'failure_probability': risk_report['failure_probability']},
-                recommendations=self._get_failure_recommendations(risk_report)
-            )
-            alerts.append(alert)
-        elif risk_report['failure_probability']['overall'] > 40:
-            alert = self.create_alert(
-                alert_type='FAILURE_PREDICTION',
-                severity='warning',
-                title='Warning: Elevated Failure Risk',
-                description=f"System has {risk_report['failure_probability']['overall']}% probability of failure in next 72 hours",
-                metrics={'failure_probability': risk_report['failure_probability']},
-                recommendations=self._get_failure_recommendations(risk_report)
-            )
-            alerts.append(alert)
+        specs = self._derive_alerts(report_json)
+        alerts = [self._alerts_by_id.get(spec['alert_id']) for spec in specs]
         
-        # Low health score alert
-        if risk_report['health_score'] < 50:
-            alert = self.create_alert(
-                alert_type='HEALTH_DEGRADATION',
-                severity='critical',
-                title='Critical: System Health Severely Degraded',
-                description=f"Overall health score: {risk_report['health_score']}/100",
-                metrics={'health_score': risk_report['health_score']},
-                recommendations=['Immediate investigation required', 'Consider rollback to last stable version']
-            )
-            alerts.append(alert)
-        elif risk_report['health_score'] < 70:
-            alert = self.create_alert(
-                alert_type='HEALTH_DEGRADATION',
-                severity='warning',
-                title='Warning: System Health Declining',
-                description=f"Overall health score: {risk_report['health_score']}/100",
-                metrics={'health_score': risk_report['health_score']},
-                recommendations=['Monitor closely', 'Review recent changes']
-            )
-            alerts.append(alert)
+        # Create the alerts not already active in a single batch
+        created = iter(self.create_alerts_batch(
+            [spec for spec, alert in zip(specs, alerts) if alert is None]
+        ))
+        
+        return [alert if alert is not None else next(created) for alert in alerts]
+    
+    def generate_alerts_batch(self, reports: List[Dict]) -> List[List[Alert]]:
+        """
+        Generate alerts for several risk reports at once
+        
+        Threshold checks run as array comparisons over all reports, and only
+        reports that cross a threshold or have a critical root cause go
+        through per-report alert generation.
+        
+        Args:
+            reports: Risk reports, e.g. one per monitored service
+            
+        Returns:
+            Alerts for each report, in the order of reports
+        """
+        fp = np.array([r['failure_probability']['overall'] for r in reports], dtype=float)
+        hs = np.array([r['health_score'] for r in reports], dtype=float)
+        has_critical = np.array(
+            [any(c['severity'] == 'critical' for c in r['root_causes']) for r in reports],
+            dtype=bool
+        )
+        
+        # Lowest alerting thresholds from the tables above
+        fires = (
+            (fp > min(t[0] for t in _FAILURE_THRESHOLDS))
+            | (hs < max(t[0] for t in _HEALTH_THRESHOLDS))
+            | has_critical
+        )
+        
+        results: List[List[Alert]] = [[] for _ in reports]
+        for i in np.flatnonzero(fires):
+            results[i] = self.generate_alerts_from_risk_report(reports[i])
+        
+        return results
+    
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _derive_alerts(cls, report_json: str) -> Tuple[Dict, ...]:
+        """
+        Derive alert specs (create_alert keyword arguments) from a risk report
+        """
+        risk_report = json.loads(report_json)
+        digest = hashlib.blake2b(report_json.encode('utf-8'), digest_size=16).hexdigest()
+        specs = []
+        
+        fp = risk_report['failure_probability']
+        overall = fp['overall']
+        hs = risk_report['health_score']
+        rcs = risk_report['root_causes']
+        
+        # Failure probability alert (first matching threshold wins)
+        for threshold, severity, title in _FAILURE_THRESHOLDS:
+            if overall > threshold:
+                specs.append(dict(
+                    alert_type='FAILURE_PREDICTION',
+                    severity=severity,
+                    title=title,
+                    description=f"System has {overall:.2f}% probability of failure in next 72 hours",
+                    metrics={'failure_probability': fp},
+                    recommendations=cls._get_failure_recommendations(risk_report)
+                ))
+                break
+        
+        # Low health score alert (first matching threshold wins)
+        for threshold, severity, title, recommendations in _HEALTH_THRESHOLDS:
+            if hs < threshold:
+                specs.append(dict(
+                    alert_type='HEALTH_DEGRADATION',
+                    severity=severity,
+                    title=title,
+                    description=f"Overall health score: {hs:.2f}/100",
+                    metrics={'health_score': hs},
+                    recommendations=recommendations
+                ))
+                break
         
         # Root cause specific alerts
-        for cause in risk_report['root_causes']:
+        for cause in rcs:
             if cause['severity'] == 'critical':
-                alert = self.create_alert(
+                specs.append(dict(
                     alert_type=cause['category'].upper().replace(' ', '_'),
                     severity='critical',
                     title=f"Critical: {cause['issue']}",
@@ -106,133 +370,126 @@ class AlertGenerator:
                         'current_value': cause['current_value'],
                         'threshold': cause['threshold']
                     },
-                    recommendations=self._get_cause_specific_recommendations(cause)
-                )
-                alerts.append(alert)
+                    recommendations=cls._get_cause_specific_recommendations(cause)
+                ))
+        
+        for i, spec in enumerate(specs):
+            spec['alert_id'] = f"{digest}-{i}"
         
-        return alerts
+        return tuple(specs)
     
-    def _get_failure_recommendations(self, risk_report: Dict) -> List[str]:
+    @classmethod
+    def _get_failure_recommendations(cls, risk_report: Dict) -> List[str]:
         """
         Get recommendations based on failure risk
         """
-        recommendations = []
+        present = {c['category'] for c in risk_report.get('root_causes', [])}
         
-        # Based on root causes
-        root_causes = risk_report.get('root_causes', [])
+        # Walk categories in priority order and stop once the top 5 are filled
+        recommendations = []
+        for category in cls._CATEGORY_PRIORITY:
+            if category in present:
+                recommendations.extend(cls._CATEGORY_RECS[category])
+                if len(recommendations) >= 5:
+                    break
         
-        for cause in root_causes:
-            if cause['category'] == 'Model Performance':
-                recommendations.extend([
-                    'Retrain model with recent data',
-                    'Enable shadow deployment for new model',
-                    'Increase model validation frequency'
-                ])
-            elif cause['category'] == 'Performance':
-                recommendations.extend([
-                    'Scale up infrastructure',
-                    'Enable caching layer',
-                    'Optimize query performance'
-                ])
-            elif cause['category'] == 'Data Quality':
-                recommendations.extend([
-                    'Review data pipeline for anomalies',
-                    'Implement stricter input validation',
-                    'Update feature transformations'
-                ])
-            elif cause['category'] == 'Infrastructure':
-                recommendations.extend([
-                    'Horizontal scaling needed',
-                    'Check for resource leaks',
-                    'Review auto-scaling policies'
-                ])
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_recommendations = []
-        for rec in recommendations:
-            if rec not in seen:
-                seen.add(rec)
-                unique_recommendations.append(rec)
-        
-        return unique_recommendations[:5]  # Top 5 recommendations
+        return recommendations[:5]  # Top 5 recommendations
     
-    def _get_cause_specific_recommendations(self, cause: Dict) -> List[str]:
+    @staticmethod
+    def _get_cause_specific_recommendations(cause: Dict) -> List[str]:
         """
         Get specific recommendations for a root cause
         """
-        recommendations_map = {
-            'Accuracy Degradation': [
-                'Retrain model immediately',
-                'Check for data distribution changes',
-                'Review feature importance shifts',
-                'Enable A/B testing with previous model version'
-            ],
-            'High Latency': [
-                'Scale compute resources',
-                'Enable request batching',
-                'Optimize model inference',
-                'Implement response caching'
-            ],
-            'Elevated Error Rate': [
-                'Review recent deployments',
-                'Check dependency health',
-                'Increase retry policies',
-                'Enable circuit breakers'
-            ],
-            'High CPU Utilization': [
-                'Scale out worker instances',
-                'Optimize compute-intensive operations',
-                'Enable auto-scaling',
-                'Review CPU profiling data'
-            ],
-            'High Memory Utilization': [
-                'Check for memory leaks',
-                'Optimize data structures',
-                'Increase memory limits',
-                'Enable memory profiling'
-            ],
-            'Data Distribution Drift': [
-                'Retrain model on recent data',
-                'Update feature normalization',
-                'Review data sources',
-                'Implement drift detection alerts'
-            ],
-            'Cost Overrun': [
-                'Review resource utilization',
-                'Optimize instance types',
-                'Enable cost anomaly detection',
-                'Implement resource quotas'
-            ]
-        }
-        
-        return recommendations_map.get(cause['issue'], ['Investigate and resolve issue'])
+        return list(_CAUSE_RECOMMENDATIONS.get(cause['issue'], ('Investigate and resolve issue',)))
     
-    def get_active_alerts(self, severity: str = None) -> List[Dict]:
+    def get_active_alerts(self, severity: str = None) -> List[Alert]:
         """
         Get active alerts, optionally filtered by severity
         """
         if severity:
-            return [a for a in self.active_alerts if a['severity'] == severity]
+            return list(self._by_severity.get(severity, []))
         return self.active_alerts
     
+    def get_alert_history_frame(self) -> "pd.DataFrame":
+        """
+        Get the alert history as a DataFrame for vectorized filtering
+        
+        Returns:
+            DataFrame with id, timestamp, type and severity columns, one row per alert
+        """
+        if self._history_frame is None:
+            import pandas as pd
+            
+            frame = pd.DataFrame(self._history_columns)
+            frame['timestamp'] = pd.to_datetime(frame['timestamp'])
+            frame['severity'] = frame['severity'].astype('category')
+            self._history_frame = frame
+        
+        return self._history_frame
+    
     def get_alert_summary(self) -> Dict:
         """
         Get summary of all alerts
         """
-        critical = len([a for a in self.active_alerts if a['severity'] == 'critical'])
-        warning = len([a for a in self.active_alerts if a['severity'] == 'warning'])
-        info = len([a for a in self.active_alerts if a['severity'] == 'info'])
-        
         return {
             'total_active': len(self.active_alerts),
-            'critical': critical,
-            'warning': warning,
-            'info': info,
+            'critical': self._severity_counts['critical'],
+            'warning': self._severity_counts['warning'],
+            'info': self._severity_counts['info'],
             'total_historical': len(self.alert_history)
         }
 
 
+# Mitigation plan actions by trigger and horizon
+_INCIDENT_IMMEDIATE = (
+    'Activate incident response team',
+    'Prepare rollback procedures',
+    'Enable enhanced monitoring',
+    'Notify stakeholders of elevated risk'
+)
+
+_MODEL_IMMEDIATE = ('Switch to backup model if available',)
+_MODEL_SHORT = (
+    'Initiate model retraining pipeline',
+    'Analyze model performance degradation',
+    'Review recent data quality issues'
+)
+_MODEL_LONG = (
+    'Implement continuous model monitoring',
+    'Set up automated retraining pipeline',
+    'Establish model performance SLAs'
+)
+
+_INFRA_IMMEDIATE = ('Scale up critical resources',)
+_INFRA_SHORT = (
+    'Review resource allocation',
+    'Optimize infrastructure configuration',
+    'Check for resource leaks'
+)
+_INFRA_LONG = (
+    'Implement auto-scaling policies',
+    'Review capacity planning',
+    'Optimize resource efficiency'
+)
+
+_DATA_IMMEDIATE = ('Enable data quality checks',)
+_DATA_SHORT = (
+    'Investigate data source changes',
+    'Review ETL pipeline health',
+    'Validate data transformations'
+)
+_DATA_LONG = (
+    'Implement automated data validation',
+    'Set up data drift monitoring',
+    'Establish data quality SLAs'
+)
+
+
+# Risk levels and incident priorities indexed by threshold tier
+_RISK_LEVELS: Tuple[str, ...] = ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')
+_PRIORITIES: Tuple[str, ...] = ('P3 - Low', 'P2 - Medium', 'P1 - High', 'P0 - Critical')
+
+
 class RecommendationEngine:
     """
     Provides actionable recommendations for system issues
@@ -243,6 +500,9 @@ class RecommendationEngine:
         Generate comprehensive mitigation plan
         """
         root_causes = risk_report.get('root_causes', [])
+        failure_prob = risk_report['failure_probability']['overall']
+        health_score = risk_report['health_score']
+        critical_count = sum(1 for c in root_causes if c['severity'] == 'critical')
         
         immediate_actions = []
         short_term_actions = []
@@ -250,89 +510,55 @@ class RecommendationEngine:
         
         # Immediate actions (next 1-4 hours)
         if risk_report['failure_probability']['24h'] > 50:
-            immediate_actions.extend([
-                'Activate incident response team',
-                'Prepare rollback procedures',
-                'Enable enhanced monitoring',
-                'Notify stakeholders of elevated risk'
-            ])
+            immediate_actions.extend(_INCIDENT_IMMEDIATE)
         
         # Analyze root causes for specific actions
-        has_model_issues = any(c['category'] == 'Model Performance' for c in root_causes)
-        has_infra_issues = any(c['category'] == 'Infrastructure' for c in root_causes)
-        has_data_issues = any(c['category'] == 'Data Quality' for c in root_causes)
+        present = {c['category'] for c in root_causes}
+        has_model_issues = 'Model Performance' in present
+        has_infra_issues = 'Infrastructure' in present
+        has_data_issues = 'Data Quality' in present
         
         if has_model_issues:
-            immediate_actions.append('Switch to backup model if available')
-            short_term_actions.extend([
-                'Initiate model retraining pipeline',
-                'Analyze model performance degradation',
-                'Review recent data quality issues'
-            ])
-            long_term_actions.extend([
-                'Implement continuous model monitoring',
-                'Set up automated retraining pipeline',
-                'Establish model performance SLAs'
-            ])
+            immediate_actions.extend(_MODEL_IMMEDIATE)
+            short_term_actions.extend(_MODEL_SHORT)
+            long_term_actions.extend(_MODEL_LONG)
         
         if has_infra_issues:
-            immediate_actions.append('Scale up critical resources')
-            short_term_actions.extend([
-                'Review resource allocation',
-                'Optimize infrastructure configuration',
-                'Check for resource leaks'
-            ])
-            long_term_actions.extend([
-                'Implement auto-scaling policies',
-                'Review capacity planning',
-                'Optimize resource efficiency'
-            ])
+            immediate_actions.extend(_INFRA_IMMEDIATE)
+            short_term_actions.extend(_INFRA_SHORT)
+            long_term_actions.extend(_INFRA_LONG)
         
         if has_data_issues:
-            immediate_actions.append('Enable data quality checks')
-            short_term_actions.extend([
-                'Investigate data source changes',
-                'Review ETL pipeline health',
-                'Validate data transformations'
-            ])
-            long_term_actions.extend([
-                'Implement automated data validation',
-                'Set up data drift monitoring',
-                'Establish data quality SLAs'
-            ])
+            immediate_actions.extend(_DATA_IMMEDIATE)
+            short_term_actions.extend(_DATA_SHORT)
+            long_term_actions.extend(_DATA_LONG)
         
         return {
-            'risk_level': self._get_risk_level(risk_report),
+            'risk_level': self._get_risk_level(failure_prob, health_score),
             'immediate_actions': immediate_actions[:5],
             'short_term_actions': short_term_actions[:5],
             'long_term_actions': long_term_actions[:5],
-            'estimated_mttr': self._estimate_mttr(risk_report),
-            'priority': self._calculate_priority(risk_report)
+            'estimated_mttr': self._estimate_mttr(critical_count),
+            'priority': self._calculate_priority(failure_prob, health_score)
         }
     
-    def _get_risk_level(self, risk_report: Dict) -> str:
+    @staticmethod
+    def _get_risk_level(failure_prob: float, health_score: float) -> str:
         """
         Determine overall risk level
-        """
-        failure_prob = risk_report['failure_probability']['overall']
-        health_score = risk_report['health_score']
         
-        if failure_prob > 70 or health_score < 50:
-            return 'CRITICAL'
-        elif failure_prob > 40 or health_score < 70:
-            return 'HIGH'
-        elif failure_prob > 20 or health_score < 85:
-            return 'MEDIUM'
-        else:
-            return 'LOW'
+        Each input maps to a tier (0-3) by how many thresholds it crosses;
+        the worse of the two tiers indexes _RISK_LEVELS.
+        """
+        fp_tier = (failure_prob > 20) + (failure_prob > 40) + (failure_prob > 70)
+        hs_tier = (health_score < 85) + (health_score < 70) + (health_score < 50)
+        return _RISK_LEVELS[max(fp_tier, hs_tier)]
     
-    def _estimate_mttr(self, risk_report: Dict) -> str:
+    @staticmethod
+    def _estimate_mttr(critical_count: int) -> str:
         """
-        Estimate Mean Time To Recovery
+        Estimate Mean Time To Recovery from the number of critical root causes
         """
-        root_causes = risk_report.get('root_causes', [])
-        critical_count = sum(1 for c in root_causes if c['severity'] == 'critical')
-        
         if critical_count >= 3:
             return '4-8 hours'
         elif critical_count >= 1:
@@ -340,18 +566,15 @@ class RecommendationEngine:
         else:
             return '1-2 hours'
     
-    def _calculate_priority(self, risk_report: Dict) -> str:
+    @staticmethod
+    def _calculate_priority(failure_prob: float, health_score: float) -> str:
         """
         Calculate incident priority
-        """
-        failure_prob = risk_report['failure_probability']['overall']
-        health_score = risk_report['health_score']
         
-        if failure_prob > 70 and health_score < 50:
-            return 'P0 - Critical'
-        elif failure_prob > 50 or health_score < 60:
-            return 'P1 - High'
-        elif failure_prob > 30 or health_score < 75:
-            return 'P2 - Medium'
-        else:
-            return 'P3 - Low'
+        P1-P3 come from the worse of the two threshold tiers; P0 needs both
+        a failure probability above 70 and a health score below 50.
+        """
+        fp_tier = (failure_prob > 30) + (failure_prob > 50)
+        hs_tier = (health_score < 75) + (health_score < 60)
+        critical = failure_prob > 70 and health_score < 50
+        return _PRIORITIES[max(fp_tier, hs_tier) + critical]
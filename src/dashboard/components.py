@@ -4,35 +4,26 @@ Enterprise-grade UI components with glassmorphism design
 """
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 import pandas as pd
+from string import Template
+import functools
 from typing import Dict, List
 
+from src.monitoring.risk_engine import format_root_cause
 
-def apply_custom_css():
-    """
-    Apply custom CSS for glassmorphism and dark mode
-    """
-    st.markdown("""
+
+# Dashboard stylesheet, injected on every rerun
+_CSS = """
     <style>
-    /* Dark theme and glassmorphism */
+    /* Dark theme; translucent tints instead of backdrop blur, which repaints on every chart update */
     .stApp {
         background: linear-gradient(135deg, #0f0c29, #302b63, #24243e);
-        background-size: 400% 400%;
-        animation: gradient 15s ease infinite;
-    }
-    
-    @keyframes gradient {
-        0% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-        100% { background-position: 0% 50%; }
     }
     
     /* Glass card effect */
     .glass-card {
-        background: rgba(255, 255, 255, 0.05);
-        backdrop-filter: blur(10px);
+        background: rgba(20, 20, 40, 0.55);
         border-radius: 20px;
         border: 1px solid rgba(255, 255, 255, 0.1);
         padding: 25px;
@@ -43,7 +34,6 @@ def apply_custom_css():
     /* Metric cards */
     .metric-card {
         background: linear-gradient(135deg, rgba(102, 126, 234, 0.1), rgba(118, 75, 162, 0.1));
-        backdrop-filter: blur(10px);
         border-radius: 15px;
         border: 1px solid rgba(255, 255, 255, 0.1);
         padding: 20px;
@@ -55,7 +45,6 @@ def apply_custom_css():
     .alert-critical {
         background: linear-gradient(135deg, rgba(239, 68, 68, 0.2), rgba(220, 38, 38, 0.2));
         border-left: 4px solid #ef4444;
-        backdrop-filter: blur(10px);
         border-radius: 10px;
         padding: 15px;
         margin: 10px 0;
@@ -64,7 +53,6 @@ def apply_custom_css():
     .alert-warning {
         background: linear-gradient(135deg, rgba(251, 191, 36, 0.2), rgba(245, 158, 11, 0.2));
         border-left: 4px solid #fbbf24;
-        backdrop-filter: blur(10px);
         border-radius: 10px;
         padding: 15px;
         margin: 10px 0;
@@ -109,7 +97,6 @@ def apply_custom_css():
     /* Executive summary box */
     .executive-summary {
         background: linear-gradient(135deg, rgba(16, 185, 129, 0.1), rgba(5, 150, 105, 0.1));
-        backdrop-filter: blur(10px);
         border-radius: 15px;
         border: 1px solid rgba(16, 185, 129, 0.3);
         padding: 20px;
@@ -134,8 +121,7 @@ def apply_custom_css():
     
     /* Sidebar */
     .css-1d391kg {
-        background: rgba(0, 0, 0, 0.3);
-        backdrop-filter: blur(10px);
+        background: rgba(0, 0, 0, 0.6);
     }
     
     /* Hide Streamlit branding */
@@ -143,7 +129,86 @@ def apply_custom_css():
     footer {visibility: hidden;}
     
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+# Time series longer than this are thinned before being sent to Plotly
+MAX_PLOT_POINTS = 2000
+
+_RISK_COLOR = {
+    'CRITICAL': '🔴',
+    'HIGH': '🟠',
+    'MEDIUM': '🟡',
+    'LOW': '🟢'
+}
+
+_SEVERITY_ICON = {
+    'critical': '🚨',
+    'warning': '⚠️'
+}
+
+_ROOT_CAUSE_TEMPLATE = Template("""
+        <div class="alert-$severity">
+            <h4>$icon $issue</h4>
+            <p><strong>Category:</strong> $category</p>
+            <p><strong>Current:</strong> $current_value | <strong>Threshold:</strong> $threshold</p>
+            <p><strong>Impact:</strong> $impact</p>
+            <p>$description</p>
+        </div>
+        """)
+
+_ALERT_TEMPLATE = Template("""
+        <div class="alert-$severity">
+            <p><strong>$icon $title</strong></p>
+            <p style='font-size: 0.9em;'>$description</p>
+            <p style='font-size: 0.8em; opacity: 0.7;'>$timestamp</p>
+        </div>
+        """)
+
+_METRIC_CARD_TEMPLATE = Template("""
+        <div class="metric-card">
+            <h2 style='margin: 0; font-size: 2em;'>$value</h2>
+            <p style='margin: 5px 0; opacity: 0.8;'>$label</p>
+        </div>
+        """)
+
+
+def _downsample(df: pd.DataFrame, n_max: int = MAX_PLOT_POINTS) -> pd.DataFrame:
+    """
+    Thin a time series to at most about n_max rows by taking every k-th row
+    """
+    if len(df) <= n_max:
+        return df
+    return df.iloc[::-(-len(df) // n_max)]
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> tuple:
+    """
+    Cache key for a plotted frame: shape, columns and a vectorized content hash
+    """
+    return len(df), tuple(df.columns), int(pd.util.hash_pandas_object(df, index=False).sum())
+
+
+# Built figures are shared read-only across reruns and sessions
+_cache_figure = st.cache_resource(
+    max_entries=16,
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: _frame_fingerprint}
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _display_timestamp(iso_timestamp: str) -> str:
+    """
+    Format an ISO timestamp for display; alerts in a batch share one timestamp
+    """
+    return datetime.fromisoformat(iso_timestamp).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def apply_custom_css():
+    """
+    Apply custom CSS for glassmorphism and dark mode
+    """
+    st.markdown(_CSS, unsafe_allow_html=True)
 
 
 def render_header():
@@ -174,6 +239,15 @@ def render_health_score_gauge(health_score: float):
     """
     Render system health score gauge
     """
+    # Round as the metric cards do, so nearby scores share a cached figure
+    return _health_score_gauge(round(health_score, 1))
+
+
+@_cache_figure
+def _health_score_gauge(health_score: float):
+    """
+    Build the health score gauge figure
+    """
     # Determine color based on health score
     if health_score >= 80:
         color = "green"
@@ -235,7 +309,7 @@ def render_failure_probability_gauge(failure_prob: float):
         value = failure_prob,
         domain = {'x': [0, 1], 'y': [0, 1]},
         title = {'text': "Failure Probability (72h)", 'font': {'size': 24, 'color': 'white'}},
-        number = {'suffix': "%"},
+        number = {'suffix': "%", 'valueformat': '.2f'},
         gauge = {
             'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "white"},
             'bar': {'color': color},
@@ -268,13 +342,39 @@ def render_failure_probability_gauge(failure_prob: float):
 def render_timeline_forecast(forecast_data: pd.DataFrame):
     """
     Render timeline forecast chart
+    
+    The figure is kept in session state and only its trace data is replaced
+    on later reruns, so the layout is built once per session.
+    """
+    forecast_data = _downsample(forecast_data)
+    key = _frame_fingerprint(forecast_data)
+    
+    figures = st.session_state.setdefault('_figures', {})
+    cached = figures.get('timeline')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    fig = cached[1] if cached is not None else _build_timeline_figure()
+    with fig.batch_update():
+        fig.data[0].x = forecast_data['timestamp']
+        fig.data[0].y = forecast_data['failure_probability']
+        fig.data[1].x = forecast_data['timestamp']
+        fig.data[1].y = forecast_data['health_score']
+    
+    figures['timeline'] = (key, fig)
+    return fig
+
+
+def _build_timeline_figure() -> go.Figure:
+    """
+    Build the timeline forecast figure with empty traces
     """
     fig = go.Figure()
     
     # Add traces
     fig.add_trace(go.Scatter(
-        x=forecast_data['timestamp'],
-        y=forecast_data['failure_probability'],
+        x=[],
+        y=[],
         mode='lines',
         name='Failure Probability',
         line=dict(color='#ef4444', width=3),
@@ -283,8 +383,8 @@ def render_timeline_forecast(forecast_data: pd.DataFrame):
     ))
     
     fig.add_trace(go.Scatter(
-        x=forecast_data['timestamp'],
-        y=forecast_data['health_score'],
+        x=[],
+        y=[],
         mode='lines',
         name='Health Score',
         line=dict(color='#10b981', width=3),
@@ -315,6 +415,7 @@ def render_timeline_forecast(forecast_data: pd.DataFrame):
         plot_bgcolor='rgba(0,0,0,0.2)',
         font={'color': 'white'},
         hovermode='x unified',
+        uirevision='timeline',
         legend=dict(
             bgcolor='rgba(0,0,0,0.5)',
             bordercolor='rgba(255,255,255,0.2)',
@@ -326,10 +427,12 @@ def render_timeline_forecast(forecast_data: pd.DataFrame):
     return fig
 
 
+@_cache_figure
 def render_metrics_dashboard(metrics_df: pd.DataFrame):
     """
     Render key metrics over time
     """
+    metrics_df = _downsample(metrics_df)
     fig = go.Figure()
     
     # Accuracy
@@ -375,6 +478,7 @@ def render_metrics_dashboard(metrics_df: pd.DataFrame):
         plot_bgcolor='rgba(0,0,0,0.2)',
         font={'color': 'white'},
         hovermode='x unified',
+        uirevision='constant',
         legend=dict(
             bgcolor='rgba(0,0,0,0.5)',
             bordercolor='rgba(255,255,255,0.2)',
@@ -386,10 +490,13 @@ def render_metrics_dashboard(metrics_df: pd.DataFrame):
     return fig
 
 
+@_cache_figure
 def render_cost_monitor(cost_data: pd.DataFrame):
     """
     Render cost explosion monitor
     """
+    avg_cost = cost_data['cost_per_hour'].mean()
+    cost_data = _downsample(cost_data)
     fig = go.Figure()
     
     fig.add_trace(go.Scatter(
@@ -403,7 +510,6 @@ def render_cost_monitor(cost_data: pd.DataFrame):
     ))
     
     # Add threshold line
-    avg_cost = cost_data['cost_per_hour'].mean()
     fig.add_hline(
         y=avg_cost * 1.5,
         line_dash="dash",
@@ -428,6 +534,7 @@ def render_cost_monitor(cost_data: pd.DataFrame):
         plot_bgcolor='rgba(0,0,0,0.2)',
         font={'color': 'white'},
         hovermode='x unified',
+        uirevision='constant',
         height=300
     )
     
@@ -442,19 +549,20 @@ def render_root_cause_panel(root_causes: List[Dict]):
         st.info("✅ No critical issues detected")
         return
     
-    for cause in root_causes:
-        severity_class = f"alert-{cause['severity']}"
-        severity_icon = "🚨" if cause['severity'] == 'critical' else "⚠️"
-        
-        st.markdown(f"""
-        <div class="{severity_class}">
-            <h4>{severity_icon} {cause['issue']}</h4>
-            <p><strong>Category:</strong> {cause['category']}</p>
-            <p><strong>Current:</strong> {cause['current_value']} | <strong>Threshold:</strong> {cause['threshold']}</p>
-            <p><strong>Impact:</strong> {cause['impact']}</p>
-            <p>{cause['description']}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # One markdown element for the whole panel
+    st.markdown("".join(
+        _ROOT_CAUSE_TEMPLATE.substitute(
+            severity=cause['severity'],
+            icon='🚨' if cause['severity'] == 'critical' else '⚠️',
+            issue=cause['issue'],
+            category=cause['category'],
+            current_value=cause['current_value'],
+            threshold=cause['threshold'],
+            impact=cause['impact'],
+            description=cause['description']
+        )
+        for cause in map(format_root_cause, root_causes)
+    ), unsafe_allow_html=True)
 
 
 def render_alert_feed(alerts: List[Dict]):
@@ -465,19 +573,17 @@ def render_alert_feed(alerts: List[Dict]):
         st.success("✅ No active alerts")
         return
     
-    for alert in alerts[:10]:  # Show latest 10
-        severity_class = f"alert-{alert['severity']}"
-        severity_icon = "🚨" if alert['severity'] == 'critical' else "⚠️" if alert['severity'] == 'warning' else "ℹ️"
-        
-        timestamp = datetime.fromisoformat(alert['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
-        
-        st.markdown(f"""
-        <div class="{severity_class}">
-            <p><strong>{severity_icon} {alert['title']}</strong></p>
-            <p style='font-size: 0.9em;'>{alert['description']}</p>
-            <p style='font-size: 0.8em; opacity: 0.7;'>{timestamp}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # One markdown element for the whole feed
+    st.markdown("".join(
+        _ALERT_TEMPLATE.substitute(
+            severity=alert['severity'],
+            icon=_SEVERITY_ICON.get(alert['severity'], 'ℹ️'),
+            title=alert['title'],
+            description=alert['description'],
+            timestamp=_display_timestamp(alert['timestamp'])
+        )
+        for alert in alerts[:10]  # Show latest 10
+    ), unsafe_allow_html=True)
 
 
 def render_executive_summary(risk_report: Dict, mitigation_plan: Dict):
@@ -491,12 +597,7 @@ def render_executive_summary(risk_report: Dict, mitigation_plan: Dict):
     
     # Risk assessment
     risk_level = mitigation_plan.get('risk_level', 'UNKNOWN')
-    risk_color = {
-        'CRITICAL': '🔴',
-        'HIGH': '🟠',
-        'MEDIUM': '🟡',
-        'LOW': '🟢'
-    }.get(risk_level, '⚪')
+    risk_color = _RISK_COLOR.get(risk_level, '⚪')
     
     st.markdown(f"""
         <p><strong>Risk Level:</strong> {risk_color} {risk_level}</p>
@@ -519,37 +620,14 @@ def render_metric_cards(health_score: float, failure_prob: float,
     """
     Render metric summary cards
     """
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h2 style='margin: 0; font-size: 2em;'>{health_score:.1f}</h2>
-            <p style='margin: 5px 0; opacity: 0.8;'>Health Score</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h2 style='margin: 0; font-size: 2em;'>{failure_prob:.1f}%</h2>
-            <p style='margin: 5px 0; opacity: 0.8;'>Failure Risk</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h2 style='margin: 0; font-size: 2em;'>{active_alerts}</h2>
-            <p style='margin: 5px 0; opacity: 0.8;'>Active Alerts</p>
-        </div>
-        """, unsafe_allow_html=True)
+    trend_icon = "📈" if trend == "improving" else "📉" if trend == "degrading" else "➡️"
+    cards = (
+        (f"{health_score:.1f}", 'Health Score'),
+        (f"{failure_prob:.1f}%", 'Failure Risk'),
+        (active_alerts, 'Active Alerts'),
+        (trend_icon, trend.title())
+    )
     
-    with col4:
-        trend_icon = "📈" if trend == "improving" else "📉" if trend == "degrading" else "➡️"
-        st.markdown(f"""
-        <div class="metric-card">
-            <h2 style='margin: 0; font-size: 2em;'>{trend_icon}</h2>
-            <p style='margin: 5px 0; opacity: 0.8;'>{trend.title()}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    for col, (value, label) in zip(st.columns(4), cards):
+        with col:
+            st.markdown(_METRIC_CARD_TEMPLATE.substitute(value=value, label=label), unsafe_allow_html=True)
@@ -2,10 +2,128 @@
 Feature Engineering for ML System Monitoring
 Extracts and creates predictive features from raw metrics
 """
+import os
 import pandas as pd
 import numpy as np
-from typing import Dict, List
-from sklearn.preprocessing import StandardScaler
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+# Engineered frames remembered per FeatureEngineer, keyed on input content
+ENGINEER_CACHE_SIZE = 4
+
+# bottleneck provides single-pass C moving-window kernels; fall back to pandas rolling
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+# numba JIT-compiles the streaming z-score kernel; fall back to _rolling_stats
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Frames with at least this many rows compute rolling windows on parallel threads
+PARALLEL_MIN_ROWS = 50_000
+
+_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Get the thread pool used for parallel rolling windows"""
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
+
+
+# Rolling statistics computed by _rolling_stats
+ROLLING_STATS = ('mean', 'std', 'min', 'max')
+
+
+def _rolling_stats(X: np.ndarray, window: int, stats=ROLLING_STATS) -> Dict[str, np.ndarray]:
+    """
+    Rolling statistics down each column of a 2-D array
+    
+    Matches pandas rolling(window, min_periods=1) semantics (sample std).
+    
+    Args:
+        X: Array of shape (n_rows, n_columns)
+        window: Window length in rows
+        stats: Statistics to compute, from ROLLING_STATS
+        
+    Returns:
+        Dictionary of statistic name to array with the shape of X
+    """
+    if BOTTLENECK_AVAILABLE and len(X):
+        # With min_count=1 a window longer than the data behaves like the full length
+        w = min(window, len(X))
+        kernels = {
+            'mean': lambda: bn.move_mean(X, w, min_count=1, axis=0),
+            # Sample std is undefined for a single observation, as in pandas
+            'std': lambda: bn.move_std(X, w, min_count=2, axis=0, ddof=1),
+            'min': lambda: bn.move_min(X, w, min_count=1, axis=0),
+            'max': lambda: bn.move_max(X, w, min_count=1, axis=0),
+        }
+        return {stat: kernels[stat]() for stat in stats}
+    
+    rolling = pd.DataFrame(X).rolling(window=window, min_periods=1)
+    return {stat: getattr(rolling, stat)().to_numpy(copy=True) for stat in stats}
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _rolling_zscore(X, window, eps):
+        """
+        Rolling z-score and anomaly flag (|z| > 3) down each column of X
+        
+        Keeps a running sum and sum of squares per column, so each step is
+        O(1) regardless of window. Values are shifted by the column's first
+        row to limit cancellation in the variance. Expects finite input; the
+        z-score is 0 where the window holds a single observation.
+        """
+        n, m = X.shape
+        zscore = np.empty((n, m), dtype=np.float64)
+        is_anomaly = np.zeros((n, m), dtype=np.int8)
+        
+        for j in range(m):
+            shift = X[0, j] if n > 0 else 0.0
+            total = 0.0
+            total_sq = 0.0
+            for i in range(n):
+                x = X[i, j] - shift
+                total += x
+                total_sq += x * x
+                if i >= window:
+                    old = X[i - window, j] - shift
+                    total -= old
+                    total_sq -= old * old
+                
+                count = min(i + 1, window)
+                mean = total / count
+                if count < 2:
+                    # No spread yet with a single observation
+                    zscore[i, j] = 0.0
+                    continue
+                
+                var = max((total_sq - total * mean) / (count - 1), 0.0)
+                z = (x - mean) / (np.sqrt(var) + eps)
+                zscore[i, j] = z
+                if abs(z) > 3:
+                    is_anomaly[i, j] = 1
+        
+        return zscore, is_anomaly
+
+
+def _with_columns(df: pd.DataFrame, new_columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Return df with new_columns appended in a single concat
+    """
+    return pd.concat([df, pd.DataFrame(new_columns, index=df.index)], axis=1)
 
 
 class FeatureEngineer:
@@ -14,143 +132,234 @@ class FeatureEngineer:
     """
     
     def __init__(self):
-        self.scaler = StandardScaler()
+        # Recently engineered frames by input fingerprint, oldest first
+        self._engineered = OrderedDict()
+        
+        # Per-feature standardization parameters, set by fit_transform
+        self.mean_ = None
+        self.std_ = None
         self.feature_names = []
         
     def create_time_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Extract temporal features from timestamp
         """
-        df = df.copy()
-        df['hour'] = pd.to_datetime(df['timestamp']).dt.hour
-        df['day_of_week'] = pd.to_datetime(df['timestamp']).dt.dayofweek
-        df['is_weekend'] = df['day_of_week'].isin([5, 6]).astype(int)
-        df['is_business_hours'] = df['hour'].between(9, 17).astype(int)
+        return _with_columns(df, self._time_columns(df))
+    
+    def _time_columns(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        # Parse timestamps once and derive every field from the arrays
+        ts = pd.to_datetime(df['timestamp'], cache=True)
+        hour = ts.dt.hour.to_numpy()
+        day_of_week = ts.dt.dayofweek.to_numpy()
         
         # Cyclical encoding for hour and day
-        df['hour_sin'] = np.sin(2 * np.pi * df['hour'] / 24)
-        df['hour_cos'] = np.cos(2 * np.pi * df['hour'] / 24)
-        df['day_sin'] = np.sin(2 * np.pi * df['day_of_week'] / 7)
-        df['day_cos'] = np.cos(2 * np.pi * df['day_of_week'] / 7)
+        hour_angle = hour * (2 * np.pi / 24)
+        day_angle = day_of_week * (2 * np.pi / 7)
         
-        return df
+        return {
+            'hour': hour,
+            'day_of_week': day_of_week,
+            'is_weekend': (day_of_week >= 5).astype(np.int8),
+            'is_business_hours': ((hour >= 9) & (hour <= 17)).astype(np.int8),
+            'hour_sin': np.sin(hour_angle),
+            'hour_cos': np.cos(hour_angle),
+            'day_sin': np.sin(day_angle),
+            'day_cos': np.cos(day_angle)
+        }
     
     def create_rolling_features(self, df: pd.DataFrame, windows: List[int] = [6, 12, 24]) -> pd.DataFrame:
         """
         Create rolling statistics for time-series features
         """
-        df = df.copy()
-        
+        return _with_columns(df, self._rolling_columns(df, windows))
+    
+    def _rolling_columns(self, df: pd.DataFrame, windows: List[int] = [6, 12, 24]) -> Dict[str, np.ndarray]:
         metric_columns = [
             'accuracy', 'latency_ms', 'error_rate', 
             'cpu_utilization', 'memory_utilization', 
             'cost_per_hour', 'data_drift_score'
         ]
         
-        for window in windows:
-            for col in metric_columns:
-                if col in df.columns:
-                    # Rolling statistics
-                    df[f'{col}_rolling_mean_{window}h'] = df[col].rolling(window=window, min_periods=1).mean()
-                    df[f'{col}_rolling_std_{window}h'] = df[col].rolling(window=window, min_periods=1).std()
-                    df[f'{col}_rolling_min_{window}h'] = df[col].rolling(window=window, min_periods=1).min()
-                    df[f'{col}_rolling_max_{window}h'] = df[col].rolling(window=window, min_periods=1).max()
+        cols = [col for col in metric_columns if col in df.columns]
+        X = df[cols].to_numpy(dtype=np.float64)
         
-        return df
+        # Windows are independent and the kernels release the GIL, so large
+        # frames compute them on threads
+        if len(X) >= PARALLEL_MIN_ROWS and len(windows) > 1:
+            window_stats = _get_pool().map(lambda window: _rolling_stats(X, window), windows)
+        else:
+            window_stats = (_rolling_stats(X, window) for window in windows)
+        
+        # Rolling statistics over all metrics at once
+        new_columns = {}
+        for window, stats in zip(windows, window_stats):
+            # Std is NaN where the window holds a single observation; report no spread
+            np.nan_to_num(stats['std'], copy=False, nan=0.0)
+            for j, col in enumerate(cols):
+                for stat in ROLLING_STATS:
+                    new_columns[f'{col}_rolling_{stat}_{window}h'] = stats[stat][:, j]
+        
+        return new_columns
     
     def create_trend_features(self, df: pd.DataFrame, windows: List[int] = [12, 24, 48]) -> pd.DataFrame:
         """
         Calculate trend and rate of change features
         """
-        df = df.copy()
-        
+        return _with_columns(df, self._trend_columns(df, windows))
+    
+    def _trend_columns(self, df: pd.DataFrame, windows: List[int] = [12, 24, 48]) -> Dict[str, np.ndarray]:
         metric_columns = [
             'accuracy', 'latency_ms', 'error_rate',
             'cpu_utilization', 'memory_utilization'
         ]
         
-        for window in windows:
-            for col in metric_columns:
-                if col in df.columns:
-                    # Rate of change
-                    df[f'{col}_change_{window}h'] = df[col].diff(window)
-                    
-                    # Percentage change
-                    df[f'{col}_pct_change_{window}h'] = df[col].pct_change(window)
+        cols = [col for col in metric_columns if col in df.columns]
+        X = df[cols].to_numpy(dtype=np.float64)
         
-        return df
+        # One zeroed buffer for every (window, change/pct_change) pair; the
+        # first rows of each window stay 0 and columns are views into it
+        out = np.zeros((len(windows), 2) + X.shape)
+        
+        new_columns = {}
+        for i, window in enumerate(windows):
+            # Rate of change and percentage change for all metrics
+            change, pct_change = out[i]
+            if window < len(X):
+                np.subtract(X[window:], X[:-window], out=change[window:])
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    np.divide(X[window:], X[:-window], out=pct_change[window:])
+                pct_change[window:] -= 1
+                # 0/0 and NaN inputs leave them undefined; report no change (x/0 stays inf)
+                np.nan_to_num(change, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
+                np.nan_to_num(pct_change, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
+            
+            for j, col in enumerate(cols):
+                new_columns[f'{col}_change_{window}h'] = change[:, j]
+                new_columns[f'{col}_pct_change_{window}h'] = pct_change[:, j]
+        
+        return new_columns
     
     def create_interaction_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Create interaction features between metrics
         """
-        df = df.copy()
+        return _with_columns(df, self._interaction_columns(df))
+    
+    def _interaction_columns(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        # Source columns as arrays, pulled once; request volume + 1 is shared
+        col = {name: df[name].to_numpy(dtype=np.float64) for name in (
+            'request_volume', 'latency_ms', 'cpu_utilization', 'memory_utilization',
+            'cost_per_hour', 'accuracy', 'data_drift_score', 'error_rate'
+        ) if name in df.columns}
+        
+        new_columns = {}
+        if 'request_volume' in col:
+            requests_plus_1 = col['request_volume'] + 1.0
         
         # Performance indicators
-        if 'latency_ms' in df.columns and 'request_volume' in df.columns:
-            df['throughput'] = df['request_volume'] / (df['latency_ms'] + 1)
+        if 'latency_ms' in col and 'request_volume' in col:
+            new_columns['throughput'] = col['request_volume'] / (col['latency_ms'] + 1.0)
         
         # Resource efficiency
-        if 'cpu_utilization' in df.columns and 'request_volume' in df.columns:
-            df['cpu_per_request'] = df['cpu_utilization'] / (df['request_volume'] + 1)
+        if 'cpu_utilization' in col and 'request_volume' in col:
+            new_columns['cpu_per_request'] = col['cpu_utilization'] / requests_plus_1
         
-        if 'memory_utilization' in df.columns and 'request_volume' in df.columns:
-            df['memory_per_request'] = df['memory_utilization'] / (df['request_volume'] + 1)
+        if 'memory_utilization' in col and 'request_volume' in col:
+            new_columns['memory_per_request'] = col['memory_utilization'] / requests_plus_1
         
         # Cost efficiency
-        if 'cost_per_hour' in df.columns and 'request_volume' in df.columns:
-            df['cost_per_request'] = df['cost_per_hour'] / (df['request_volume'] + 1)
+        if 'cost_per_hour' in col and 'request_volume' in col:
+            new_columns['cost_per_request'] = col['cost_per_hour'] / requests_plus_1
         
         # Quality metrics
-        if 'accuracy' in df.columns and 'data_drift_score' in df.columns:
-            df['accuracy_drift_interaction'] = df['accuracy'] * (1 - df['data_drift_score'])
+        if 'accuracy' in col and 'data_drift_score' in col:
+            new_columns['accuracy_drift_interaction'] = col['accuracy'] * (1.0 - col['data_drift_score'])
         
         # System stress indicator
-        if 'cpu_utilization' in df.columns and 'memory_utilization' in df.columns:
-            df['system_stress'] = (df['cpu_utilization'] + df['memory_utilization']) / 2
+        if 'cpu_utilization' in col and 'memory_utilization' in col:
+            new_columns['system_stress'] = (col['cpu_utilization'] + col['memory_utilization']) / 2
         
         # Error density
-        if 'error_rate' in df.columns and 'request_volume' in df.columns:
-            df['error_count'] = df['error_rate'] * df['request_volume']
+        if 'error_rate' in col and 'request_volume' in col:
+            new_columns['error_count'] = col['error_rate'] * col['request_volume']
         
-        return df
+        return new_columns
     
     def create_anomaly_scores(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate statistical anomaly scores
         """
-        df = df.copy()
-        
+        return _with_columns(df, self._anomaly_columns(df))
+    
+    def _anomaly_columns(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
         metric_columns = [
             'accuracy', 'latency_ms', 'error_rate',
             'cpu_utilization', 'memory_utilization'
         ]
         
-        for col in metric_columns:
-            if col in df.columns:
-                mean = df[col].rolling(window=24*7, min_periods=1).mean()
-                std = df[col].rolling(window=24*7, min_periods=1).std()
-                
-                # Z-score based anomaly detection
-                df[f'{col}_zscore'] = (df[col] - mean) / (std + 1e-6)
-                df[f'{col}_is_anomaly'] = (np.abs(df[f'{col}_zscore']) > 3).astype(int)
+        cols = [col for col in metric_columns if col in df.columns]
+        X = df[cols].to_numpy(dtype=np.float64)
         
-        return df
+        # Z-score based anomaly detection across all metrics
+        if NUMBA_AVAILABLE and np.isfinite(X).all():
+            zscore, is_anomaly = _rolling_zscore(X, 24*7, 1e-6)
+        else:
+            stats = _rolling_stats(X, 24*7, stats=('mean', 'std'))
+            zscore = (X - stats['mean']) / (stats['std'] + 1e-6)
+            np.nan_to_num(zscore, copy=False, nan=0.0)
+            is_anomaly = (np.abs(zscore) > 3).astype(np.int8)
+        
+        new_columns = {}
+        for j, col in enumerate(cols):
+            new_columns[f'{col}_zscore'] = zscore[:, j]
+            new_columns[f'{col}_is_anomaly'] = is_anomaly[:, j]
+        
+        return new_columns
     
     def engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply all feature engineering transformations
+        
+        Every step computes its columns from the raw metrics as arrays, and
+        all of them are added to the frame in one concat. Undefined values
+        are filled where they are computed instead of by a final sweep:
+        rolling std, z-score, change and pct_change are 0 at window edges,
+        for 0/0 and where an input metric is NaN.
+        
+        NaNs in the input metrics are not imputed. Rolling statistics skip
+        them, but the raw columns and the interaction features keep NaN on
+        the affected rows; fill the input first (e.g. fillna(0)) if a dense
+        frame is required.
+        
+        Results are cached per input content, so an unchanged frame (e.g. on
+        a dashboard rerun) returns a copy of the previous result.
         """
-        df = self.create_time_features(df)
-        df = self.create_rolling_features(df)
-        df = self.create_trend_features(df)
-        df = self.create_interaction_features(df)
-        df = self.create_anomaly_scores(df)
+        # Vectorized content hash; far cheaper than the feature expansion
+        key = (tuple(df.columns), len(df), int(pd.util.hash_pandas_object(df).sum()))
+        cached = self._engineered.get(key)
+        if cached is not None:
+            self._engineered.move_to_end(key)
+            return cached.copy()
+        
+        new_columns = {}
+        new_columns.update(self._time_columns(df))
+        new_columns.update(self._rolling_columns(df))
+        new_columns.update(self._trend_columns(df))
+        new_columns.update(self._interaction_columns(df))
+        new_columns.update(self._anomaly_columns(df))
+        
+        # Downcast engineered float columns; flag columns are created as int8
+        for col, values in new_columns.items():
+            if values.dtype == np.float64:
+                new_columns[col] = values.astype(np.float32)
+        
+        df = _with_columns(df, new_columns)
         
-        # Fill NaN values created by rolling operations
-        df = df.bfill().fillna(0)
+        self._engineered[key] = df
+        if len(self._engineered) > ENGINEER_CACHE_SIZE:
+            self._engineered.popitem(last=False)
         
-        return df
+        return df.copy()
     
     def get_feature_columns(self, df: pd.DataFrame) -> List[str]:
         """
@@ -166,18 +375,37 @@ class FeatureEngineer:
         feature_cols = self.get_feature_columns(df)
         self.feature_names = feature_cols
         
-        df_scaled = df.copy()
-        df_scaled[feature_cols] = self.scaler.fit_transform(df[feature_cols])
+        X = df[feature_cols].to_numpy(dtype=np.float32)
+        self.mean_ = X.mean(axis=0, dtype=np.float64).astype(np.float32)
+        std = X.std(axis=0, dtype=np.float64)
         
-        return df_scaled
+        # Constant features are centered but not scaled, as in StandardScaler
+        std[std == 0] = 1.0
+        self.std_ = std.astype(np.float32)
+        
+        return self._scaled_frame(df, feature_cols, X)
     
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Transform features using fitted scaler
         """
         feature_cols = self.get_feature_columns(df)
+        X = df[feature_cols].to_numpy(dtype=np.float32)
+        
+        return self._scaled_frame(df, feature_cols, X)
+    
+    def _scaled_frame(self, df: pd.DataFrame, feature_cols: List[str], X: np.ndarray) -> pd.DataFrame:
+        """
+        Standardize X in place and rebuild a frame with df's column order
+        """
+        np.subtract(X, self.mean_, out=X)
+        np.divide(X, self.std_, out=X)
+        
+        df_scaled = pd.DataFrame(X, columns=feature_cols, index=df.index)
         
-        df_scaled = df.copy()
-        df_scaled[feature_cols] = self.scaler.transform(df[feature_cols])
+        # Put back the excluded (non-feature) columns at their original positions
+        for position, col in enumerate(df.columns):
+            if col not in df_scaled.columns:
+                df_scaled.insert(position, col, df[col])
         
         return df_scaled
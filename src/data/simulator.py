@@ -2,11 +2,211 @@
 Data Simulator for ML System Metrics
 Generates realistic logs, metrics, drift, latency, and cost data
 """
+import os
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
-import random
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import hashlib
+
+try:
+    import pyarrow  # noqa: F401  (parquet engine)
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+# Failure scenario ramp: (column, relative change at full progress, upper cap)
+FAILURE_RAMP = (
+    ('accuracy', -0.3, None),           # Accuracy decay
+    ('latency_ms', 2, None),            # Latency spike
+    ('error_rate', 5, None),            # Error rate increase
+    ('cpu_utilization', 1, 95),         # Resource exhaustion
+    ('memory_utilization', 1, 95),
+    ('cost_per_hour', 1.5, None),       # Cost spike
+    ('data_drift_score', 2, 0.9),       # Data drift
+)
+
+
+# Bump when the metric formulas change so stale parquet caches are not reused
+METRICS_CACHE_VERSION = 3
+
+# Float metric columns in frame order; request_volume (int32) is inserted after latency_ms
+METRIC_FLOAT_COLUMNS = (
+    'accuracy', 'latency_ms', 'error_rate', 'cpu_utilization', 'memory_utilization',
+    'cost_per_hour', 'data_drift_score', 'pipeline_success_rate'
+)
+
+# Synthetic log vocabulary; LOG_MESSAGE_TEMPLATES is aligned with LOG_LEVELS
+LOG_LEVELS = ('INFO', 'WARNING', 'ERROR', 'CRITICAL')
+LOG_LEVEL_WEIGHTS = (0.70, 0.20, 0.08, 0.02)
+LOG_SOURCES = ('MODEL_INFERENCE', 'DATA_PIPELINE', 'API_GATEWAY', 'DATABASE', 'CACHE')
+RETRY_ATTEMPTS = 3
+
+_ROUTINE_MESSAGES = (
+    "Request processed successfully in {source}",
+    "Health check passed for {source}",
+    "Batch job completed in {source}",
+)
+
+LOG_MESSAGE_TEMPLATES = (
+    _ROUTINE_MESSAGES,
+    (
+        "High memory usage in {source}",
+        "Slow query detected in {source}",
+        "Retry attempt {attempt} for {source}",
+        "Cache miss rate elevated in {source}",
+    ),
+    (
+        "Timeout connecting to {source}",
+        "Failed to process request in {source}",
+        "High latency detected in {source}",
+        "Resource exhaustion in {source}",
+    ),
+    _ROUTINE_MESSAGES,
+)
+
+
+def _build_log_message_table() -> np.ndarray:
+    """Render every (level, template, source, attempt) message once"""
+    max_templates = max(len(templates) for templates in LOG_MESSAGE_TEMPLATES)
+    table = np.full(
+        (len(LOG_LEVELS), max_templates, len(LOG_SOURCES), RETRY_ATTEMPTS), '', dtype=object
+    )
+    for level_id, templates in enumerate(LOG_MESSAGE_TEMPLATES):
+        for template_id, template in enumerate(templates):
+            for source_id, source in enumerate(LOG_SOURCES):
+                for attempt in range(RETRY_ATTEMPTS):
+                    table[level_id, template_id, source_id, attempt] = template.format(
+                        source=source, attempt=attempt + 1
+                    )
+    return table
+
+
+_LOG_MESSAGE_TABLE = _build_log_message_table()
+
+
+@lru_cache(maxsize=4)
+def _seasonal_basis(hours: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Shared daily (sin(2*pi*t/24) + 1) and weekly (sin(2*pi*t/168)) cycles for the first `hours` hours
+    """
+    t = np.arange(hours, dtype=np.float32)
+    daily = np.sin(t * np.float32(2 * np.pi / 24))
+    daily += 1
+    weekly = np.sin(t * np.float32(2 * np.pi / (24 * 7)))
+    # Cached arrays are shared between calls
+    daily.flags.writeable = False
+    weekly.flags.writeable = False
+    return daily, weekly
+
+
+def _generate_metric_columns(hours: int, failure_effect: np.ndarray, spike_effect: np.ndarray,
+                             rng: np.random.Generator) -> pd.DataFrame:
+    """
+    Generate metrics for `hours` rows given the failure and spike effects,
+    drawing noise from rng
+    """
+    # Every float metric is written in place into one float32 buffer, one row per column
+    t = np.arange(hours, dtype=np.float32)
+    buf = np.empty((len(METRIC_FLOAT_COLUMNS), hours), dtype=np.float32)
+    noise = np.empty(hours, dtype=np.float32)
+    accuracy, latency, error_rate, cpu, memory, cost, drift, pipeline_success = buf
+    daily, weekly = _seasonal_basis(hours)
+    
+    # Model accuracy with gradual degradation and sudden drops
+    base_accuracy = 0.95
+    np.multiply(weekly, 0.02, out=accuracy)  # Weekly pattern
+    accuracy += base_accuracy
+    np.multiply(t, -0.0001, out=noise)  # Gradual drift
+    accuracy += noise
+    rng.standard_normal(out=noise, dtype=np.float32)
+    noise *= 0.01
+    accuracy += noise
+    accuracy += failure_effect
+    np.clip(accuracy, 0.5, 1.0, out=accuracy)
+    
+    # Latency with spikes
+    base_latency = 50  # ms
+    np.multiply(daily, 20, out=latency)  # Daily pattern
+    latency += base_latency
+    rng.standard_exponential(out=noise, dtype=np.float32)
+    noise *= 10
+    latency += noise
+    latency += spike_effect
+    np.clip(latency, 10, 500, out=latency)
+    
+    # Request volume (cost's row is free scratch space until cost is computed)
+    base_volume = 10000
+    np.multiply(daily, 5000, out=cost)
+    cost += base_volume
+    rng.standard_normal(out=noise, dtype=np.float32)
+    noise *= 1000
+    cost += noise
+    np.clip(cost, 1000, 30000, out=cost)
+    volume = cost.astype(np.int32)
+    
+    # Error rate
+    base_error_rate = 0.01
+    np.divide(accuracy, 0.95, out=error_rate)
+    np.subtract(1, error_rate, out=error_rate)
+    error_rate *= 0.005
+    error_rate += base_error_rate
+    rng.standard_exponential(out=noise, dtype=np.float32)
+    noise *= 0.005
+    error_rate += noise
+    np.clip(error_rate, 0, 0.5, out=error_rate)
+    
+    # CPU utilization
+    base_cpu = 45
+    np.multiply(daily, 30, out=cpu)
+    cpu += base_cpu
+    rng.standard_normal(out=noise, dtype=np.float32)
+    noise *= 5
+    cpu += noise
+    np.clip(cpu, 10, 100, out=cpu)
+    
+    # Memory utilization
+    base_memory = 60
+    np.multiply(t, 0.01, out=memory)  # Gradual increase
+    memory += base_memory
+    rng.standard_normal(out=noise, dtype=np.float32)
+    noise *= 3
+    memory += noise
+    np.clip(memory, 20, 95, out=memory)
+    
+    # Cost per hour: base_cost * (cpu / 50) * (volume / 10000)
+    base_cost = 10
+    np.multiply(cpu, volume, out=cost)
+    cost *= base_cost / (50 * 10000)
+    rng.standard_normal(out=noise, dtype=np.float32)
+    noise *= 2
+    cost += noise
+    np.clip(cost, 1, 100, out=cost)
+    
+    # Data drift score (0-1, higher = more drift)
+    base_drift = 0.1
+    np.multiply(t, 0.0005, out=drift)
+    drift += base_drift
+    rng.standard_normal(out=noise, dtype=np.float32)
+    noise *= 0.05
+    drift += noise
+    np.clip(drift, 0, 1, out=drift)
+    
+    # Pipeline success rate
+    np.divide(error_rate, 0.05, out=pipeline_success)
+    pipeline_success *= -0.1
+    pipeline_success += 0.98
+    rng.standard_normal(out=noise, dtype=np.float32)
+    noise *= 0.02
+    pipeline_success += noise
+    np.clip(pipeline_success, 0.5, 1.0, out=pipeline_success)
+    
+    df = pd.DataFrame(buf.T, columns=METRIC_FLOAT_COLUMNS, copy=False)
+    df.insert(2, 'request_volume', volume)
+    
+    return df
 
 
 class MLSystemDataSimulator:
@@ -14,182 +214,124 @@ class MLSystemDataSimulator:
     Simulates ML system operational data for failure prediction
     """
     
-    def __init__(self, days_history: int = 90):
+    def __init__(self, days_history: int = 90, seed: Optional[int] = None,
+                 cache_dir: Optional[str] = '.cache'):
         self.days_history = days_history
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.cache_dir = cache_dir
         self.base_timestamp = datetime.now() - timedelta(days=days_history)
         
     def generate_metrics_data(self) -> pd.DataFrame:
         """
         Generate time-series metrics data for ML system
         Returns DataFrame with realistic operational metrics
+        
+        Seeded runs are reproducible, so their metrics are cached as parquet
+        under cache_dir and reloaded on later calls.
         """
         hours = self.days_history * 24
-        timestamps = [self.base_timestamp + timedelta(hours=i) for i in range(hours)]
+        timestamps = pd.date_range(self.base_timestamp, periods=hours, freq='h')
         
-        # Base patterns
-        t = np.arange(hours)
+        cache_path = self._metrics_cache_path()
+        if cache_path is not None and os.path.exists(cache_path):
+            df = pd.read_parquet(cache_path)
+        else:
+            df = self._generate_metrics(hours)
+            if cache_path is not None:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                df.to_parquet(tmp_path, compression='zstd')
+                os.replace(tmp_path, cache_path)
         
-        # Model accuracy with gradual degradation and sudden drops
-        base_accuracy = 0.95
-        drift_effect = -0.0001 * t  # Gradual drift
-        seasonal = 0.02 * np.sin(2 * np.pi * t / (24 * 7))  # Weekly pattern
-        random_noise = np.random.normal(0, 0.01, hours)
+        # Timestamps are relative to now, so they are never cached
+        df.insert(0, 'timestamp', timestamps)
         
-        # Add failure events (sudden drops)
-        failure_points = random.sample(range(hours), k=max(1, hours // 500))
-        failure_effect = np.zeros(hours)
-        for fp in failure_points:
-            failure_effect[fp:min(fp+24, hours)] = -0.1  # 24-hour degradation
-        
-        accuracy = base_accuracy + drift_effect + seasonal + random_noise + failure_effect
-        accuracy = np.clip(accuracy, 0.5, 1.0)
+        return df
+    
+    def _metrics_cache_path(self) -> Optional[str]:
+        """
+        Parquet cache file for this simulator's metrics, or None when not cacheable
+        """
+        if self.seed is None or self.cache_dir is None or not PARQUET_AVAILABLE:
+            return None
         
-        # Latency with spikes
-        base_latency = 50  # ms
-        traffic_pattern = 20 * (np.sin(2 * np.pi * t / 24) + 1)  # Daily pattern
-        latency_noise = np.random.exponential(10, hours)
+        key = hashlib.md5(
+            f"{METRICS_CACHE_VERSION}|{self.days_history}|{self.seed}".encode()
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"metrics_{key}.parquet")
+    
+    def _generate_metrics(self, hours: int) -> pd.DataFrame:
+        """
+        Generate the metric columns for `hours` rows
+        """
+        # Seeded series restart their stream so they always match the cache key
+        rng = np.random.default_rng(self.seed) if self.seed is not None else self.rng
         
-        # Latency spikes
-        spike_points = random.sample(range(hours), k=max(1, hours // 300))
+        failure_effect = np.zeros(hours)
+        failure_effect[self._event_window_index(rng, hours, max(1, hours // 500), 24)] = -0.1  # 24-hour degradation
         spike_effect = np.zeros(hours)
-        for sp in spike_points:
-            spike_effect[sp:min(sp+6, hours)] = 200  # 6-hour spike
-        
-        latency = base_latency + traffic_pattern + latency_noise + spike_effect
-        latency = np.clip(latency, 10, 500)
-        
-        # Request volume
-        base_volume = 10000
-        volume = base_volume + 5000 * (np.sin(2 * np.pi * t / 24) + 1)
-        volume += np.random.normal(0, 1000, hours)
-        volume = np.clip(volume, 1000, 30000).astype(int)
-        
-        # Error rate
-        base_error_rate = 0.01
-        error_rate = base_error_rate + 0.005 * (1 - accuracy / 0.95)
-        error_rate += np.random.exponential(0.005, hours)
-        error_rate = np.clip(error_rate, 0, 0.5)
-        
-        # CPU utilization
-        base_cpu = 45
-        cpu = base_cpu + 30 * (np.sin(2 * np.pi * t / 24) + 1)
-        cpu += np.random.normal(0, 5, hours)
-        cpu = np.clip(cpu, 10, 100)
-        
-        # Memory utilization
-        base_memory = 60
-        memory_leak = 0.01 * t  # Gradual increase
-        memory = base_memory + memory_leak + np.random.normal(0, 3, hours)
-        memory = np.clip(memory, 20, 95)
-        
-        # Cost per hour
-        base_cost = 10
-        cost = base_cost * (cpu / 50) * (volume / 10000)
-        cost += np.random.normal(0, 2, hours)
-        cost = np.clip(cost, 1, 100)
-        
-        # Data drift score (0-1, higher = more drift)
-        base_drift = 0.1
-        drift_accumulation = 0.0005 * t
-        drift = base_drift + drift_accumulation + np.random.normal(0, 0.05, hours)
-        drift = np.clip(drift, 0, 1)
-        
-        # Pipeline success rate
-        pipeline_success = 0.98 - 0.1 * (error_rate / 0.05)
-        pipeline_success += np.random.normal(0, 0.02, hours)
-        pipeline_success = np.clip(pipeline_success, 0.5, 1.0)
-        
-        df = pd.DataFrame({
-            'timestamp': timestamps,
-            'accuracy': accuracy,
-            'latency_ms': latency,
-            'request_volume': volume,
-            'error_rate': error_rate,
-            'cpu_utilization': cpu,
-            'memory_utilization': memory,
-            'cost_per_hour': cost,
-            'data_drift_score': drift,
-            'pipeline_success_rate': pipeline_success
-        })
+        spike_effect[self._event_window_index(rng, hours, max(1, hours // 300), 6)] = 200  # 6-hour spike
         
-        return df
+        return _generate_metric_columns(hours, failure_effect, spike_effect, rng)
+    
+    @staticmethod
+    def _event_window_index(rng: np.random.Generator, hours: int, n_events: int,
+                            duration: int) -> np.ndarray:
+        """
+        Row indices covered by `n_events` distinct events of `duration` hours each,
+        truncated at the end of the series
+        """
+        starts = rng.choice(hours, size=min(n_events, hours), replace=False)
+        idx = starts[:, None] + np.arange(duration)[None, :]
+        return np.clip(idx, 0, hours - 1).ravel()
     
     def generate_logs(self, n_logs: int = 1000) -> pd.DataFrame:
         """
         Generate synthetic log data
         """
-        log_levels = ['INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        log_sources = ['MODEL_INFERENCE', 'DATA_PIPELINE', 'API_GATEWAY', 'DATABASE', 'CACHE']
-        
-        logs = []
         base_time = datetime.now() - timedelta(hours=24)
+        # Offsets are sorted up front so the frame comes out in time order
+        seconds = np.sort(self.rng.integers(0, 86401, n_logs))
+        timestamps = base_time + pd.to_timedelta(seconds, unit='s')
+        
+        levels = self.rng.choice(len(LOG_LEVELS), n_logs, p=LOG_LEVEL_WEIGHTS)
+        sources = self.rng.integers(0, len(LOG_SOURCES), n_logs)
         
-        for i in range(n_logs):
-            timestamp = base_time + timedelta(seconds=random.randint(0, 86400))
-            level = random.choices(log_levels, weights=[70, 20, 8, 2])[0]
-            source = random.choice(log_sources)
-            
-            # Generate realistic log messages
-            if level == 'ERROR':
-                messages = [
-                    f"Timeout connecting to {source}",
-                    f"Failed to process request in {source}",
-                    f"High latency detected in {source}",
-                    f"Resource exhaustion in {source}"
-                ]
-            elif level == 'WARNING':
-                messages = [
-                    f"High memory usage in {source}",
-                    f"Slow query detected in {source}",
-                    f"Retry attempt {random.randint(1,3)} for {source}",
-                    f"Cache miss rate elevated in {source}"
-                ]
-            else:
-                messages = [
-                    f"Request processed successfully in {source}",
-                    f"Health check passed for {source}",
-                    f"Batch job completed in {source}"
-                ]
-            
-            logs.append({
-                'timestamp': timestamp,
-                'level': level,
-                'source': source,
-                'message': random.choice(messages)
-            })
-        
-        return pd.DataFrame(logs).sort_values('timestamp')
+        # Pick a template per row from its level's list, then look up the pre-rendered message
+        n_templates = np.array([len(templates) for templates in LOG_MESSAGE_TEMPLATES])
+        template_ids = (self.rng.random(n_logs) * n_templates[levels]).astype(int)
+        attempts = self.rng.integers(0, RETRY_ATTEMPTS, n_logs)
+        messages = _LOG_MESSAGE_TABLE[levels, template_ids, sources, attempts]
+        
+        logs = pd.DataFrame({
+            'timestamp': timestamps,
+            'level': pd.Categorical.from_codes(levels, categories=LOG_LEVELS),
+            'source': pd.Categorical.from_codes(sources, categories=LOG_SOURCES),
+            'message': messages
+        })
+        
+        return logs
     
     def inject_failure_scenario(self, df: pd.DataFrame, 
                                start_idx: int, duration_hours: int = 48) -> pd.DataFrame:
         """
         Inject a failure scenario into the data
         """
-        df_copy = df.copy()
+        # Shallow copy: untouched columns share their data with the input frame
+        df_copy = df.copy(deep=False)
         end_idx = min(start_idx + duration_hours, len(df))
         
-        # Gradual degradation leading to failure
-        for i in range(start_idx, end_idx):
-            progress = (i - start_idx) / duration_hours
-            
-            # Accuracy decay
-            df_copy.loc[i, 'accuracy'] *= (1 - 0.3 * progress)
-            
-            # Latency spike
-            df_copy.loc[i, 'latency_ms'] *= (1 + 2 * progress)
-            
-            # Error rate increase
-            df_copy.loc[i, 'error_rate'] *= (1 + 5 * progress)
-            
-            # Resource exhaustion
-            df_copy.loc[i, 'cpu_utilization'] = min(95, df_copy.loc[i, 'cpu_utilization'] * (1 + progress))
-            df_copy.loc[i, 'memory_utilization'] = min(95, df_copy.loc[i, 'memory_utilization'] * (1 + progress))
-            
-            # Cost spike
-            df_copy.loc[i, 'cost_per_hour'] *= (1 + 1.5 * progress)
-            
-            # Data drift
-            df_copy.loc[i, 'data_drift_score'] = min(0.9, df_copy.loc[i, 'data_drift_score'] * (1 + 2 * progress))
+        # Gradual degradation leading to failure, applied to the whole window at once
+        progress = np.arange(max(end_idx - start_idx, 0)) / duration_hours
+        
+        for col, rate, cap in FAILURE_RAMP:
+            values = df[col].to_numpy(copy=True)
+            window = values[start_idx:end_idx]
+            window *= 1 + rate * progress
+            if cap is not None:
+                np.minimum(window, cap, out=window)
+            df_copy[col] = values
         
         return df_copy
     
@@ -202,17 +344,20 @@ class MLSystemDataSimulator:
         
         # Create failure labels (look ahead 48 hours)
         window = 48
-        labels = pd.Series(0, index=df.index)
+        
+        # Forward-looking extremes over rows [i, i + window), via trailing rolling windows shifted back
+        shift = -(window - 1)
+        future_acc_min = df['accuracy'].rolling(window).min().shift(shift)
+        future_lat_max = df['latency_ms'].rolling(window).max().shift(shift)
+        future_err_max = df['error_rate'].rolling(window).max().shift(shift)
         
         # Detect failures (significant accuracy drop or latency spike)
-        for i in range(len(df) - window):
-            future_window = df.iloc[i:i+window]
-            
-            accuracy_drop = (df.iloc[i]['accuracy'] - future_window['accuracy'].min()) > 0.1
-            latency_spike = (future_window['latency_ms'].max() - df.iloc[i]['latency_ms']) > 100
-            error_spike = (future_window['error_rate'].max() - df.iloc[i]['error_rate']) > 0.05
-            
-            if accuracy_drop or latency_spike or error_spike:
-                labels.iloc[i] = 1
+        accuracy_drop = (df['accuracy'] - future_acc_min) > 0.1
+        latency_spike = (future_lat_max - df['latency_ms']) > 100
+        error_spike = (future_err_max - df['error_rate']) > 0.05
+        
+        labels = (accuracy_drop | latency_spike | error_spike).astype(int)
+        # The last `window` rows have no full look-ahead and stay unlabeled
+        labels.iloc[max(len(df) - window, 0):] = 0
         
         return df, labels
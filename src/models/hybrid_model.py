@@ -3,12 +3,15 @@ Hybrid LSTM + XGBoost Model for Failure Prediction
 Combines temporal pattern recognition with gradient boosting
 """
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import pandas as pd
 from typing import Tuple, Dict, Optional
 import pickle
+import json
 import os
 
 try:
+    import tensorflow as tf
     from tensorflow import keras
     from tensorflow.keras.models import Sequential, Model, load_model
     from tensorflow.keras.layers import LSTM, Dense, Dropout, Input
@@ -20,6 +23,13 @@ except ImportError:
     Model = None
     Sequential = None
 
+try:
+    import tf2onnx
+    import onnxruntime as ort
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
 try:
     import xgboost as xgb
     XGBOOST_AVAILABLE = True
@@ -29,6 +39,12 @@ except ImportError:
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
 
+# XGBoost device ('cpu' or 'cuda'); histogram training runs on either
+XGB_DEVICE = os.getenv('XGB_DEVICE', 'cpu')
+
+# Keras dtype policy for the LSTM's hidden layers; 'mixed_bfloat16' on bf16-capable GPUs/CPUs
+LSTM_PRECISION_POLICY = os.getenv('LSTM_PRECISION_POLICY', 'float32')
+
 
 class HybridFailurePredictionModel:
     """
@@ -44,21 +60,26 @@ class HybridFailurePredictionModel:
         self.dropout_rate = dropout_rate
         
         self.lstm_model = None
+        self._lstm_infer = None
+        self._lstm_onnx = None
         self.xgb_model = None
         self.feature_names = []
         
     def create_sequences(self, data: np.ndarray, labels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
         Create sequences for LSTM input
+        Sequence i is data[i:i + sequence_length], labelled with labels[i + sequence_length]
         """
-        X_seq = []
-        y_seq = []
-        
-        for i in range(len(data) - self.sequence_length):
-            X_seq.append(data[i:i + self.sequence_length])
-            y_seq.append(labels[i + self.sequence_length])
+        return self._make_X_sequences(data), labels[self.sequence_length:]
+    
+    def _make_X_sequences(self, data: np.ndarray) -> np.ndarray:
+        """
+        Zero-copy strided view of every window that has a following row
+        """
+        if len(data) <= self.sequence_length:
+            return np.empty((0, self.sequence_length) + data.shape[1:], dtype=data.dtype)
         
-        return np.array(X_seq), np.array(y_seq)
+        return sliding_window_view(data, (self.sequence_length, data.shape[1]))[:-1, 0]
     
     def build_lstm_model(self, input_shape: Tuple) -> Optional[Model]:
         """
@@ -68,15 +89,17 @@ class HybridFailurePredictionModel:
             print("TensorFlow not available. LSTM model will not be used.")
             return None
             
+        # Hidden layers follow the precision policy; the sigmoid output stays float32 for a stable loss
+        policy = LSTM_PRECISION_POLICY
         model = Sequential([
-            LSTM(self.lstm_units, return_sequences=True, input_shape=input_shape),
-            Dropout(self.dropout_rate),
-            LSTM(self.lstm_units // 2, return_sequences=False),
-            Dropout(self.dropout_rate),
-            Dense(64, activation='relu'),
-            Dropout(self.dropout_rate),
-            Dense(32, activation='relu'),
-            Dense(1, activation='sigmoid')
+            LSTM(self.lstm_units, return_sequences=True, input_shape=input_shape, dtype=policy),
+            Dropout(self.dropout_rate, dtype=policy),
+            LSTM(self.lstm_units // 2, return_sequences=False, dtype=policy),
+            Dropout(self.dropout_rate, dtype=policy),
+            Dense(64, activation='relu', dtype=policy),
+            Dropout(self.dropout_rate, dtype=policy),
+            Dense(32, activation='relu', dtype=policy),
+            Dense(1, activation='sigmoid', dtype='float32')
         ])
         
         model.compile(
@@ -97,11 +120,17 @@ class HybridFailurePredictionModel:
         if not TENSORFLOW_AVAILABLE:
             return {'status': 'skipped', 'reason': 'TensorFlow not available'}
         
-        # Create sequences
-        X_seq, y_seq = self.create_sequences(X, y)
+        # Stream windows instead of materialising every sequence; like Keras'
+        # validation_split, the last fraction of sequences is held out
+        n_sequences = max(len(X) - self.sequence_length, 0)
+        split = int(np.floor(n_sequences * (1.0 - validation_split)))
+        train_ds = self._make_sequence_dataset(X, y, 0, split, batch_size, shuffle=True)
+        val_ds = self._make_sequence_dataset(X, y, split, n_sequences, batch_size, shuffle=False)
         
         # Build model
         self.lstm_model = self.build_lstm_model((self.sequence_length, X.shape[1]))
+        self._lstm_infer = None
+        self._lstm_onnx = None
         
         # Callbacks
         early_stopping = EarlyStopping(
@@ -112,10 +141,9 @@ class HybridFailurePredictionModel:
         
         # Train
         history = self.lstm_model.fit(
-            X_seq, y_seq,
-            validation_split=validation_split,
+            train_ds,
+            validation_data=val_ds,
             epochs=epochs,
-            batch_size=batch_size,
             callbacks=[early_stopping],
             verbose=0
         )
@@ -127,6 +155,23 @@ class HybridFailurePredictionModel:
             'final_val_loss': history.history['val_loss'][-1]
         }
     
+    def _make_sequence_dataset(self, X: np.ndarray, y: np.ndarray, start: int, end: int,
+                               batch_size: int, shuffle: bool):
+        """
+        Batched, prefetched tf.data pipeline over sequences [start, end), matching create_sequences
+        """
+        # Window i spans X[i:i + sequence_length] and is labelled y[i + sequence_length]
+        dataset = keras.utils.timeseries_dataset_from_array(
+            X[:-1].astype(np.float32, copy=False),
+            y[self.sequence_length:],
+            sequence_length=self.sequence_length,
+            batch_size=batch_size,
+            shuffle=shuffle,
+            start_index=start,
+            end_index=end + self.sequence_length - 1
+        )
+        return dataset.prefetch(tf.data.AUTOTUNE)
+    
     def train_xgboost(self, X: np.ndarray, y: np.ndarray) -> Dict:
         """
         Train XGBoost model
@@ -141,6 +186,8 @@ class HybridFailurePredictionModel:
         # XGBoost parameters tuned for imbalanced failure prediction
         params = {
             'objective': 'binary:logistic',
+            'tree_method': 'hist',
+            'device': XGB_DEVICE,
             'max_depth': 6,
             'learning_rate': 0.1,
             'n_estimators': 200,
@@ -207,21 +254,63 @@ class HybridFailurePredictionModel:
         
         # LSTM predictions
         if self.lstm_model is not None and TENSORFLOW_AVAILABLE:
-            X_seq, _ = self.create_sequences(X, np.zeros(len(X)))
-            lstm_pred_seq = self.lstm_model.predict(X_seq, verbose=0).flatten()
+            X_seq = self._make_X_sequences(X)
+            session = self._get_lstm_onnx(X.shape[1])
+            if session is not None:
+                inputs = {session.get_inputs()[0].name: np.ascontiguousarray(X_seq, dtype=np.float32)}
+                lstm_pred_seq = session.run(None, inputs)[0].flatten()
+            else:
+                lstm_infer = self._get_lstm_infer(X.shape[1])
+                lstm_pred_seq = lstm_infer(tf.constant(X_seq, tf.float32)).numpy().flatten()
             # Pad beginning with zeros
             lstm_pred[self.sequence_length:] = lstm_pred_seq
         
         # XGBoost predictions
         if self.xgb_model is not None and XGBOOST_AVAILABLE:
-            xgb_pred = self.xgb_model.predict_proba(X)[:, 1]
+            # Booster-level prediction returns P(failure) directly, without the (N, 2) proba array
+            best_iteration = getattr(self.xgb_model, 'best_iteration', None)
+            iteration_range = (0, best_iteration + 1) if best_iteration is not None else (0, 0)
+            xgb_pred = self.xgb_model.get_booster().inplace_predict(X, iteration_range=iteration_range)
         
         # Ensemble: weighted average (0.6 LSTM, 0.4 XGBoost)
         # LSTM better for temporal patterns, XGBoost for feature interactions
-        ensemble_pred = 0.6 * lstm_pred + 0.4 * xgb_pred
+        ensemble_pred = np.empty(len(X))
+        np.multiply(lstm_pred, 0.6, out=ensemble_pred)
+        ensemble_pred += 0.4 * xgb_pred
         
         return ensemble_pred, lstm_pred, xgb_pred
     
+    def _get_lstm_infer(self, n_features: int):
+        """
+        Graph-compiled LSTM forward pass, traced once for any batch size
+        """
+        if self._lstm_infer is None:
+            self._lstm_infer = tf.function(
+                lambda x: self.lstm_model(x, training=False),
+                input_signature=[tf.TensorSpec([None, self.sequence_length, n_features], tf.float32)]
+            )
+        return self._lstm_infer
+    
+    def _get_lstm_onnx(self, n_features: int):
+        """
+        ONNX Runtime session for the LSTM, or None to fall back to TensorFlow
+        """
+        if self._lstm_onnx is None:
+            if not ONNX_AVAILABLE:
+                return None
+            
+            try:
+                spec = (tf.TensorSpec((None, self.sequence_length, n_features), tf.float32, name='input'),)
+                model_proto, _ = tf2onnx.convert.from_keras(self.lstm_model, input_signature=spec)
+                self._lstm_onnx = ort.InferenceSession(
+                    model_proto.SerializeToString(), providers=['CPUExecutionProvider']
+                )
+            except Exception as e:
+                print(f"ONNX export failed, using TensorFlow for LSTM inference: {e}")
+                self._lstm_onnx = False
+        
+        return self._lstm_onnx or None
+    
     def get_feature_importance(self) -> Optional[pd.DataFrame]:
         """
         Get feature importance from XGBoost model
@@ -248,8 +337,8 @@ class HybridFailurePredictionModel:
             self.lstm_model.save(os.path.join(directory, 'lstm_model.h5'))
         
         if self.xgb_model is not None and XGBOOST_AVAILABLE:
-            with open(os.path.join(directory, 'xgb_model.pkl'), 'wb') as f:
-                pickle.dump(self.xgb_model, f)
+            # Native UBJSON format: compact, fast to load and stable across xgboost versions
+            self.xgb_model.save_model(os.path.join(directory, 'xgb_model.ubj'))
         
         # Save metadata
         metadata = {
@@ -259,16 +348,21 @@ class HybridFailurePredictionModel:
             'dropout_rate': self.dropout_rate
         }
         
-        with open(os.path.join(directory, 'metadata.pkl'), 'wb') as f:
-            pickle.dump(metadata, f)
+        with open(os.path.join(directory, 'metadata.json'), 'w') as f:
+            json.dump(metadata, f)
     
     def load_models(self, directory: str):
         """
         Load trained models
         """
-        # Load metadata
-        with open(os.path.join(directory, 'metadata.pkl'), 'rb') as f:
-            metadata = pickle.load(f)
+        # Load metadata (falling back to the pickle written by older versions)
+        metadata_path = os.path.join(directory, 'metadata.json')
+        if os.path.exists(metadata_path):
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+        else:
+            with open(os.path.join(directory, 'metadata.pkl'), 'rb') as f:
+                metadata = pickle.load(f)
         
         self.feature_names = metadata['feature_names']
         self.sequence_length = metadata['sequence_length']
@@ -279,9 +373,15 @@ class HybridFailurePredictionModel:
         lstm_path = os.path.join(directory, 'lstm_model.h5')
         if os.path.exists(lstm_path) and TENSORFLOW_AVAILABLE:
             self.lstm_model = load_model(lstm_path)
+            self._lstm_infer = None
+            self._lstm_onnx = None
         
         # Load XGBoost
-        xgb_path = os.path.join(directory, 'xgb_model.pkl')
+        xgb_path = os.path.join(directory, 'xgb_model.ubj')
+        legacy_xgb_path = os.path.join(directory, 'xgb_model.pkl')
         if os.path.exists(xgb_path) and XGBOOST_AVAILABLE:
-            with open(xgb_path, 'rb') as f:
+            self.xgb_model = xgb.XGBClassifier()
+            self.xgb_model.load_model(xgb_path)
+        elif os.path.exists(legacy_xgb_path) and XGBOOST_AVAILABLE:
+            with open(legacy_xgb_path, 'rb') as f:
                 self.xgb_model = pickle.load(f)
@@ -0,0 +1,62 @@
+"""
+Numba kernels for the risk engine
+Compiled ahead of time with `python -m src.monitoring._risk_kernels`, which
+writes the `risk_kernels` extension next to this file; otherwise the risk
+engine JIT-compiles the same functions with numba on first use
+"""
+import os
+
+import numpy as np
+
+# Exported AOT signatures: health_score_batch(m, weights, scale, offset, floor)
+AOT_MODULE = 'risk_kernels'
+AOT_SIGNATURES = {
+    'health_score_batch': 'f8[:](f8[:,:], f8[:], f8[:], f8[:], f8[:])',
+}
+
+
+def health_score_kernel(m, weights, scale, offset, floor):
+    """
+    Health score per row of m (HEALTH_INPUT_COLUMNS order, NaN = missing)
+    """
+    n = m.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    raw = np.empty(6, dtype=np.float64)
+    
+    for i in range(n):
+        raw[0] = m[i, 0]
+        raw[1] = m[i, 1]
+        raw[2] = m[i, 2]
+        raw[3] = (m[i, 3] + m[i, 4]) / 2
+        raw[4] = m[i, 5]
+        raw[5] = m[i, 6]
+        
+        weighted_sum = 0.0
+        total_weight = 0.0
+        for k in range(6):
+            score = raw[k] * scale[k] + offset[k]
+            if np.isnan(score):
+                continue
+            weighted_sum += max(score, floor[k]) * weights[k]
+            total_weight += weights[k]
+        
+        if total_weight == 0.0:
+            out[i] = 50.0
+        else:
+            out[i] = min(max(weighted_sum / total_weight, 0.0), 100.0)
+    
+    return out
+
+
+def compile_aot():
+    """Build the risk_kernels extension module alongside this file"""
+    from numba.pycc import CC
+    
+    cc = CC(AOT_MODULE)
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.export('health_score_batch', AOT_SIGNATURES['health_score_batch'])(health_score_kernel)
+    cc.compile()
+
+
+if __name__ == '__main__':
+    compile_aot()
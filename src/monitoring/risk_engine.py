@@ -2,18 +2,322 @@
 Risk Scoring Engine
 Calculates risk scores and provides root cause analysis
 """
+import json
+import operator
+import time
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from numpy.lib.stride_tricks import sliding_window_view
+from dataclasses import asdict, dataclass, is_dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, List, Mapping, Tuple
 from datetime import datetime, timedelta
 
+from src.monitoring._risk_kernels import health_score_kernel
+
+# numba JIT-compiles the batched health score kernel; fall back to NumPy
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# orjson serializes reports (numpy values included) in C; fall back to json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Health score components: accuracy (25%), latency (20%), error rate (20%),
+# resources (15%), data quality (10%), pipeline reliability (10%).
+# Each score is max(raw * scale + offset, floor), e.g. latency: 100 - (latency_ms - 50) / 2
+_HEALTH_WEIGHTS = np.array([0.25, 0.20, 0.20, 0.15, 0.10, 0.10])
+_HEALTH_SCALE = np.array([100.0, -0.5, -1000.0, -1.0, -100.0, 100.0])
+_HEALTH_OFFSET = np.array([0.0, 125.0, 100.0, 100.0, 100.0, 0.0])
+_HEALTH_FLOOR = np.array([-np.inf, 0.0, 0.0, 0.0, 0.0, -np.inf])
+
+@lru_cache(maxsize=1)
+def _iso_second(epoch_second: int) -> str:
+    """Local ISO-8601 timestamp for an epoch second, formatted once per second"""
+    return datetime.fromtimestamp(epoch_second).isoformat(timespec='seconds')
+
+
+# Root cause display formats per metric: (value format, threshold format, scale)
+_ROOT_CAUSE_DISPLAY = {
+    'accuracy': ('{:.3f}', '{}', 1),
+    'latency_ms': ('{:.1f}ms', '{}ms', 1),
+    'error_rate': ('{:.2f}%', '{:.2f}%', 100),
+    'cpu_utilization': ('{:.1f}%', '{}%', 1),
+    'memory_utilization': ('{:.1f}%', '{}%', 1),
+    'data_drift_score': ('{:.3f}', '{}', 1),
+    'cost_per_hour': ('${:.2f}/hr', '${}/hr', 1),
+}
+
+
+class _Record:
+    """
+    Dict-style reads for the report dataclasses, like the dicts they replaced
+    """
+    __slots__ = ()
+    
+    # Dict key -> field name, for records whose dict keys differ from their fields
+    _KEYS: ClassVar[Dict[str, str]] = {}
+    _FIELD_KEYS: ClassVar[Dict[str, str]] = {}
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, self._KEYS.get(key, key))
+    
+    def __contains__(self, key: Any) -> bool:
+        return isinstance(key, str) and self._KEYS.get(key, key) in self.__dataclass_fields__
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+    
+    def keys(self) -> List[str]:
+        return [self._FIELD_KEYS.get(name, name) for name in self.__dataclass_fields__]
+    
+    def values(self) -> List[Any]:
+        return [getattr(self, name) for name in self.__dataclass_fields__]
+    
+    def items(self) -> List[Tuple[str, Any]]:
+        return list(zip(self.keys(), self.values()))
+    
+    def to_dict(self) -> Dict:
+        """Convert to a plain dict for serialization"""
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class RootCause(_Record):
+    """A metric outside its thresholds, with raw (unformatted) values"""
+    category: str
+    issue: str
+    severity: str
+    metric: str
+    current_value: float
+    threshold: float
+    current_value_unit: str
+    impact: str
+    description: str
+    
+    def to_dict_display(self) -> Dict:
+        """Dict with current_value and threshold formatted for display"""
+        return format_root_cause(self)
+
+
+@dataclass(slots=True)
+class FailureProbability(_Record):
+    """Failure probability (%) overall and per horizon; read as fp['24h'] etc."""
+    overall: float
+    within_24h: float
+    within_48h: float
+    within_72h: float
+    confidence: float
+    
+    # Wire keys for the horizon fields
+    _KEYS = {'24h': 'within_24h', '48h': 'within_48h', '72h': 'within_72h'}
+    _FIELD_KEYS = {name: key for key, name in _KEYS.items()}
+    
+    def to_dict(self) -> Dict:
+        """Convert to a plain dict with the '24h'/'48h'/'72h' keys"""
+        return {
+            'overall': self.overall,
+            '24h': self.within_24h,
+            '48h': self.within_48h,
+            '72h': self.within_72h,
+            'confidence': self.confidence
+        }
+
+
+@dataclass(slots=True)
+class RiskReport(_Record):
+    """Output of generate_risk_report"""
+    timestamp: str
+    health_score: float
+    trend: str
+    failure_probability: FailureProbability
+    root_causes: List[RootCause]
+    metrics_snapshot: Dict
+    
+    def to_dict(self) -> Dict:
+        """Convert to a plain dict for serialization"""
+        return {
+            'timestamp': self.timestamp,
+            'health_score': self.health_score,
+            'trend': self.trend,
+            'failure_probability': self.failure_probability.to_dict(),
+            'root_causes': [cause.to_dict() for cause in self.root_causes],
+            'metrics_snapshot': self.metrics_snapshot
+        }
+
+
+def _json_default(value: Any) -> Any:
+    """Encode report dataclasses, numpy values and timestamps for json/orjson"""
+    if isinstance(value, _Record):
+        # Report dataclasses keep their dict keys (e.g. '24h') via to_dict
+        return value.to_dict()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    if isinstance(value, datetime):
+        # Covers pd.Timestamp, which subclasses datetime
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def format_root_cause(cause) -> Dict:
+    """
+    Copy of a root cause (RootCause or dict) with current_value and threshold formatted for display
+    """
+    if isinstance(cause, RootCause):
+        cause = cause.to_dict()
+    value_format, threshold_format, scale = _ROOT_CAUSE_DISPLAY[cause['metric']]
+    return {
+        **cause,
+        'current_value': value_format.format(cause['current_value'] * scale),
+        'threshold': threshold_format.format(cause['threshold'] * scale)
+    }
+
+
+# Hours of history used for the trend, and its centred regressor for the slope
+TREND_WINDOW = 24
+_TREND_X = np.arange(TREND_WINDOW) - (TREND_WINDOW - 1) / 2
+_TREND_X_SS = float(_TREND_X @ _TREND_X)
+
+
+# Frame columns read by _health_score_batch; cpu and memory average into the resources component
+HEALTH_INPUT_COLUMNS = [
+    'accuracy', 'latency_ms', 'error_rate', 'cpu_utilization',
+    'memory_utilization', 'data_drift_score', 'pipeline_success_rate'
+]
+
+
+@lru_cache(maxsize=4096)
+def _health_score(accuracy, latency_ms, error_rate, cpu, memory, drift, pipeline) -> float:
+    """
+    Health score (0-100) from HEALTH_INPUT_COLUMNS values, None for a missing metric
+    """
+    # Raw inputs in _HEALTH_WEIGHTS order; NaN marks a missing metric
+    raw = np.array([
+        np.nan if accuracy is None else accuracy,
+        np.nan if latency_ms is None else latency_ms,
+        np.nan if error_rate is None else error_rate,
+        np.nan if cpu is None or memory is None else (cpu + memory) / 2,
+        np.nan if drift is None else drift,
+        np.nan if pipeline is None else pipeline
+    ], dtype=float)
+    
+    # All six component scores at once
+    scores = np.maximum(raw * _HEALTH_SCALE + _HEALTH_OFFSET, _HEALTH_FLOOR)
+    present = ~np.isnan(scores)
+    
+    # Calculate weighted average
+    if not present.any():
+        return 50.0
+    
+    weights = _HEALTH_WEIGHTS[present]
+    health_score = np.dot(scores[present], weights) / weights.sum()
+    return min(max(float(health_score), 0.0), 100.0)
+
+
+def _health_inputs(m: np.ndarray) -> np.ndarray:
+    """Map HEALTH_INPUT_COLUMNS rows to the six raw health components"""
+    return np.column_stack([m[:, 0], m[:, 1], m[:, 2], (m[:, 3] + m[:, 4]) / 2, m[:, 5], m[:, 6]])
+
+
+# Health kernel: the AOT-built extension when present, else numba JIT, else NumPy
+try:
+    from src.monitoring.risk_kernels import health_score_batch as _health_score_kernel
+    RISK_KERNELS_AOT = True
+except ImportError:
+    RISK_KERNELS_AOT = False
+    _health_score_kernel = njit(cache=True)(health_score_kernel) if NUMBA_AVAILABLE else None
+
+
+def _health_score_batch(m: np.ndarray) -> np.ndarray:
+    """
+    Health scores (0-100) for each row of a (n, 7) HEALTH_INPUT_COLUMNS array
+    
+    Matches calculate_health_score row by row; NaN entries count as missing.
+    """
+    m = np.ascontiguousarray(m, dtype=np.float64)
+    if _health_score_kernel is not None:
+        health = _health_score_kernel(m, _HEALTH_WEIGHTS, _HEALTH_SCALE, _HEALTH_OFFSET, _HEALTH_FLOOR)
+    else:
+        scores = np.maximum(_health_inputs(m) * _HEALTH_SCALE + _HEALTH_OFFSET, _HEALTH_FLOOR)
+        present = ~np.isnan(scores)
+        total_weight = present @ _HEALTH_WEIGHTS
+        weighted_sum = np.where(present, scores, 0.0) @ _HEALTH_WEIGHTS
+        with np.errstate(invalid='ignore', divide='ignore'):
+            health = np.where(total_weight > 0, np.clip(weighted_sum / total_weight, 0, 100), 50.0)
+    return health
+
 
 class RiskScoringEngine:
     """
     Analyzes system metrics and generates risk scores with root cause analysis
     """
     
+    # Metrics whose presence determines prediction confidence
+    _EXPECTED_METRICS = frozenset({
+        'accuracy', 'latency_ms', 'error_rate', 'cpu_utilization',
+        'memory_utilization', 'data_drift_score'
+    })
+    
+    # Root cause checks, in report order: (metric, default, breaches(value, threshold),
+    # category, issue, impact, description, unit of the raw value)
+    _ROOT_CAUSE_SPECS = (
+        ('accuracy', 1.0, operator.lt, 'Model Performance', 'Accuracy Degradation', 'High',
+         'Model accuracy has fallen below acceptable thresholds', 'ratio'),
+        ('latency_ms', 0, operator.gt, 'Performance', 'High Latency', 'High',
+         'Response time exceeds acceptable limits', 'ms'),
+        ('error_rate', 0, operator.gt, 'Reliability', 'Elevated Error Rate', 'High',
+         'System error rate is abnormally high', 'ratio'),
+        ('cpu_utilization', 0, operator.gt, 'Infrastructure', 'High CPU Utilization', 'Medium',
+         'CPU usage approaching capacity limits', '%'),
+        ('memory_utilization', 0, operator.gt, 'Infrastructure', 'High Memory Utilization', 'Medium',
+         'Memory usage may lead to OOM errors', '%'),
+        ('data_drift_score', 0, operator.gt, 'Data Quality', 'Data Distribution Drift', 'High',
+         'Input data distribution has shifted significantly', 'score'),
+        ('cost_per_hour', 0, operator.gt, 'Cost', 'Cost Overrun', 'Medium',
+         'Infrastructure costs exceeding budget', '$/hr'),
+    )
+    
+    # Failure probability multiplier per health trend
+    _TREND_MULTIPLIER = {
+        'improving': 0.8,
+        'stable': 1.0,
+        'degrading': 1.3,
+        'critical': 1.5
+    }
+    
     def __init__(self):
+        # Critical-zone probability adjustments, applied as one masked dot product:
+        # a metric breaches when (value - critical) * sign > 0 (accuracy breaches below)
+        self._adj_keys = ('accuracy', 'latency_ms', 'error_rate', 'data_drift_score')
+        self._adj_defaults = (1.0, 0, 0, 0)
+        self._adj_signs = np.array([-1, 1, 1, 1])
+        self._adj_weights = np.array([0.15, 0.10, 0.15, 0.10])
+        
+        # Warning-level check over every root cause metric, for the all-healthy fast path
+        self._rc_keys = tuple(spec[0] for spec in self._ROOT_CAUSE_SPECS)
+        self._rc_defaults = tuple(spec[1] for spec in self._ROOT_CAUSE_SPECS)
+        self._rc_signs = np.array([-1 if spec[2] is operator.lt else 1 for spec in self._ROOT_CAUSE_SPECS])
+        # Positions of the adjustment metrics within the root cause vector
+        self._rc_adj_index = np.array([self._rc_keys.index(k) for k in self._adj_keys])
+        
         self.risk_thresholds = {
             'accuracy': {'critical': 0.85, 'warning': 0.90},
             'latency_ms': {'critical': 200, 'warning': 100},
@@ -24,238 +328,140 @@ class RiskScoringEngine:
             'cost_per_hour': {'critical': 50, 'warning': 30}
         }
     
+    @property
+    def risk_thresholds(self) -> Mapping[str, Mapping[str, float]]:
+        """
+        Per-metric critical/warning thresholds (read-only; assign a new mapping to change them)
+        """
+        return self._risk_thresholds
+    
+    @risk_thresholds.setter
+    def risk_thresholds(self, thresholds: Mapping[str, Mapping[str, float]]):
+        # Read-only views, so in-place edits cannot desync the derived arrays below
+        self._risk_thresholds = MappingProxyType(
+            {k: MappingProxyType(dict(v)) for k, v in thresholds.items()}
+        )
+        # Flattened (critical, warning) pairs for the hot paths
+        self._thr = {k: (v['critical'], v['warning']) for k, v in self._risk_thresholds.items()}
+        self._adj_thresholds = np.array([self._thr[k][0] for k in self._adj_keys])
+        self._rc_warning = np.array([self._thr[k][1] for k in self._rc_keys])
+    
+    def _root_cause_values(self, metrics: Dict) -> np.ndarray:
+        """
+        Root cause metrics normalized once, in _ROOT_CAUSE_SPECS order
+        """
+        return np.array([metrics.get(k, d) for k, d in zip(self._rc_keys, self._rc_defaults)], dtype=float)
+    
     def calculate_health_score(self, metrics: Dict) -> float:
         """
         Calculate overall system health score (0-100)
         """
-        scores = []
-        
-        # Accuracy contribution (25%)
-        if 'accuracy' in metrics:
-            accuracy_score = metrics['accuracy'] * 100
-            scores.append(('accuracy', accuracy_score, 0.25))
-        
-        # Latency contribution (20%)
-        if 'latency_ms' in metrics:
-            latency_score = max(0, 100 - (metrics['latency_ms'] - 50) / 2)
-            scores.append(('latency', latency_score, 0.20))
-        
-        # Error rate contribution (20%)
-        if 'error_rate' in metrics:
-            error_score = max(0, 100 - metrics['error_rate'] * 1000)
-            scores.append(('error_rate', error_score, 0.20))
-        
-        # Resource utilization contribution (15%)
-        if 'cpu_utilization' in metrics and 'memory_utilization' in metrics:
-            resource_score = 100 - (metrics['cpu_utilization'] + metrics['memory_utilization']) / 2
-            scores.append(('resources', max(0, resource_score), 0.15))
-        
-        # Data quality contribution (10%)
-        if 'data_drift_score' in metrics:
-            drift_score = max(0, 100 - metrics['data_drift_score'] * 100)
-            scores.append(('data_quality', drift_score, 0.10))
-        
-        # Pipeline reliability contribution (10%)
-        if 'pipeline_success_rate' in metrics:
-            pipeline_score = metrics['pipeline_success_rate'] * 100
-            scores.append(('pipeline', pipeline_score, 0.10))
-        
-        # Calculate weighted average
-        if not scores:
-            return 50.0
-        
-        total_weight = sum(weight for _, _, weight in scores)
-        weighted_sum = sum(score * weight for _, score, weight in scores)
-        
-        health_score = weighted_sum / total_weight
-        return round(np.clip(health_score, 0, 100), 2)
+        # Polling often repeats identical snapshots, so scores are memoized per metric tuple
+        return _health_score(*map(metrics.get, HEALTH_INPUT_COLUMNS))
     
     def calculate_failure_probability(self, 
                                      prediction_score: float,
                                      current_metrics: Dict,
-                                     historical_trend: str = 'stable') -> Dict:
+                                     historical_trend: str = 'stable') -> FailureProbability:
         """
         Calculate probability of failure in next 24-72 hours
         """
-        # Base probability from model prediction
-        base_prob = prediction_score
-        
-        # Adjust based on current metrics
-        adjustments = []
-        
-        # Check if metrics are in critical zones
-        if current_metrics.get('accuracy', 1.0) < self.risk_thresholds['accuracy']['critical']:
-            adjustments.append(0.15)
-        
-        if current_metrics.get('latency_ms', 0) > self.risk_thresholds['latency_ms']['critical']:
-            adjustments.append(0.10)
-        
-        if current_metrics.get('error_rate', 0) > self.risk_thresholds['error_rate']['critical']:
-            adjustments.append(0.15)
-        
-        if current_metrics.get('data_drift_score', 0) > self.risk_thresholds['data_drift_score']['critical']:
-            adjustments.append(0.10)
-        
-        # Trend adjustment
-        trend_multiplier = {
-            'improving': 0.8,
-            'stable': 1.0,
-            'degrading': 1.3,
-            'critical': 1.5
-        }
+        # Adjust based on which metrics are in critical zones
+        values = np.array(
+            [current_metrics.get(k, d) for k, d in zip(self._adj_keys, self._adj_defaults)], dtype=float
+        )
+        in_critical = (values - self._adj_thresholds) * self._adj_signs > 0
         
-        adjusted_prob = base_prob * trend_multiplier.get(historical_trend, 1.0)
-        adjusted_prob += sum(adjustments)
-        adjusted_prob = np.clip(adjusted_prob, 0, 1)
+        return self._failure_probability(
+            prediction_score, float(in_critical @ self._adj_weights), historical_trend, current_metrics
+        )
+    
+    def _failure_probability(self, prediction_score: float, adjustment: float,
+                             historical_trend: str, current_metrics: Dict) -> FailureProbability:
+        """
+        Failure probability from the model prediction, trend and critical-zone adjustment
+        """
+        # Base probability from model prediction, scaled by trend
+        adjusted_prob = prediction_score * self._TREND_MULTIPLIER.get(historical_trend, 1.0)
+        adjusted_prob += adjustment
+        adjusted_prob = min(max(adjusted_prob, 0.0), 1.0)
         
         # Time-based breakdown
         prob_24h = adjusted_prob * 0.4
         prob_48h = adjusted_prob * 0.7
         prob_72h = adjusted_prob
         
-        return {
-            'overall': round(adjusted_prob * 100, 2),
-            '24h': round(prob_24h * 100, 2),
-            '48h': round(prob_48h * 100, 2),
-            '72h': round(prob_72h * 100, 2),
-            'confidence': self._calculate_confidence(current_metrics)
-        }
+        return FailureProbability(
+            overall=adjusted_prob * 100,
+            within_24h=prob_24h * 100,
+            within_48h=prob_48h * 100,
+            within_72h=prob_72h * 100,
+            confidence=self._calculate_confidence(current_metrics)
+        )
     
     def _calculate_confidence(self, metrics: Dict) -> float:
         """
         Calculate confidence in the prediction
         """
         # More complete metrics = higher confidence
-        expected_metrics = ['accuracy', 'latency_ms', 'error_rate', 'cpu_utilization', 
-                          'memory_utilization', 'data_drift_score']
-        
-        present_metrics = sum(1 for m in expected_metrics if m in metrics)
-        completeness = present_metrics / len(expected_metrics)
+        completeness = len(self._EXPECTED_METRICS & metrics.keys()) / len(self._EXPECTED_METRICS)
         
         # Check data quality
         data_quality = 1.0
         if 'data_drift_score' in metrics:
             data_quality = 1 - min(metrics['data_drift_score'], 1.0)
         
-        confidence = (completeness * 0.7 + data_quality * 0.3) * 100
-        return round(confidence, 2)
+        return (completeness * 0.7 + data_quality * 0.3) * 100
     
-    def identify_root_causes(self, metrics: Dict, historical_data: pd.DataFrame = None) -> List[Dict]:
+    def identify_root_causes(self, metrics: Dict, historical_data: pd.DataFrame = None) -> List[RootCause]:
         """
         Identify potential root causes of issues
         """
-        root_causes = []
-        
-        # Check accuracy degradation
-        if metrics.get('accuracy', 1.0) < self.risk_thresholds['accuracy']['warning']:
-            severity = 'critical' if metrics['accuracy'] < self.risk_thresholds['accuracy']['critical'] else 'warning'
-            cause = {
-                'category': 'Model Performance',
-                'issue': 'Accuracy Degradation',
-                'severity': severity,
-                'current_value': f"{metrics['accuracy']:.3f}",
-                'threshold': f"{self.risk_thresholds['accuracy'][severity]}",
-                'impact': 'High',
-                'description': 'Model accuracy has fallen below acceptable thresholds'
-            }
-            root_causes.append(cause)
-        
-        # Check latency spikes
-        if metrics.get('latency_ms', 0) > self.risk_thresholds['latency_ms']['warning']:
-            severity = 'critical' if metrics['latency_ms'] > self.risk_thresholds['latency_ms']['critical'] else 'warning'
-            cause = {
-                'category': 'Performance',
-                'issue': 'High Latency',
-                'severity': severity,
-                'current_value': f"{metrics['latency_ms']:.1f}ms",
-                'threshold': f"{self.risk_thresholds['latency_ms'][severity]}ms",
-                'impact': 'High',
-                'description': 'Response time exceeds acceptable limits'
-            }
-            root_causes.append(cause)
-        
-        # Check error rates
-        if metrics.get('error_rate', 0) > self.risk_thresholds['error_rate']['warning']:
-            severity = 'critical' if metrics['error_rate'] > self.risk_thresholds['error_rate']['critical'] else 'warning'
-            cause = {
-                'category': 'Reliability',
-                'issue': 'Elevated Error Rate',
-                'severity': severity,
-                'current_value': f"{metrics['error_rate']*100:.2f}%",
-                'threshold': f"{self.risk_thresholds['error_rate'][severity]*100:.2f}%",
-                'impact': 'High',
-                'description': 'System error rate is abnormally high'
-            }
-            root_causes.append(cause)
-        
-        # Check resource exhaustion
-        cpu = metrics.get('cpu_utilization', 0)
-        memory = metrics.get('memory_utilization', 0)
-        
-        if cpu > self.risk_thresholds['cpu_utilization']['warning']:
-            severity = 'critical' if cpu > self.risk_thresholds['cpu_utilization']['critical'] else 'warning'
-            cause = {
-                'category': 'Infrastructure',
-                'issue': 'High CPU Utilization',
-                'severity': severity,
-                'current_value': f"{cpu:.1f}%",
-                'threshold': f"{self.risk_thresholds['cpu_utilization'][severity]}%",
-                'impact': 'Medium',
-                'description': 'CPU usage approaching capacity limits'
-            }
-            root_causes.append(cause)
-        
-        if memory > self.risk_thresholds['memory_utilization']['warning']:
-            severity = 'critical' if memory > self.risk_thresholds['memory_utilization']['critical'] else 'warning'
-            cause = {
-                'category': 'Infrastructure',
-                'issue': 'High Memory Utilization',
-                'severity': severity,
-                'current_value': f"{memory:.1f}%",
-                'threshold': f"{self.risk_thresholds['memory_utilization'][severity]}%",
-                'impact': 'Medium',
-                'description': 'Memory usage may lead to OOM errors'
-            }
-            root_causes.append(cause)
-        
-        # Check data drift
-        if metrics.get('data_drift_score', 0) > self.risk_thresholds['data_drift_score']['warning']:
-            severity = 'critical' if metrics['data_drift_score'] > self.risk_thresholds['data_drift_score']['critical'] else 'warning'
-            cause = {
-                'category': 'Data Quality',
-                'issue': 'Data Distribution Drift',
-                'severity': severity,
-                'current_value': f"{metrics['data_drift_score']:.3f}",
-                'threshold': f"{self.risk_thresholds['data_drift_score'][severity]}",
-                'impact': 'High',
-                'description': 'Input data distribution has shifted significantly'
-            }
-            root_causes.append(cause)
-        
-        # Check cost overrun
-        if metrics.get('cost_per_hour', 0) > self.risk_thresholds['cost_per_hour']['warning']:
-            severity = 'critical' if metrics['cost_per_hour'] > self.risk_thresholds['cost_per_hour']['critical'] else 'warning'
-            cause = {
-                'category': 'Cost',
-                'issue': 'Cost Overrun',
-                'severity': severity,
-                'current_value': f"${metrics['cost_per_hour']:.2f}/hr",
-                'threshold': f"${self.risk_thresholds['cost_per_hour'][severity]}/hr",
-                'impact': 'Medium',
-                'description': 'Infrastructure costs exceeding budget'
-            }
-            root_causes.append(cause)
-        
-        # Sort by severity
-        severity_order = {'critical': 0, 'warning': 1}
-        root_causes.sort(key=lambda x: severity_order.get(x['severity'], 2))
-        
-        return root_causes
+        return self._root_causes(self._root_cause_values(metrics).tolist())
+    
+    def _root_causes(self, values: List[float]) -> List[RootCause]:
+        """
+        Root causes from normalized values in _ROOT_CAUSE_SPECS order
+        """
+        # Bucket by severity as causes are found: critical first, then warning
+        critical = []
+        warning = []
+        thr = self._thr
+        
+        for value, (key, _, breaches, category, issue, impact, description, unit) in zip(values, self._ROOT_CAUSE_SPECS):
+            critical_threshold, warning_threshold = thr[key]
+            if not breaches(value, warning_threshold):
+                continue
+            
+            if breaches(value, critical_threshold):
+                severity, threshold, bucket = 'critical', critical_threshold, critical
+            else:
+                severity, threshold, bucket = 'warning', warning_threshold, warning
+            bucket.append(RootCause(
+                category=category,
+                issue=issue,
+                severity=severity,
+                metric=key,
+                current_value=value,
+                threshold=threshold,
+                current_value_unit=unit,
+                impact=impact,
+                description=description
+            ))
+        
+        return critical + warning
+    
+    def compute_health_series(self, historical_data: pd.DataFrame) -> np.ndarray:
+        """
+        Health score for every row of a metrics frame, in one batched pass
+        """
+        columns = historical_data.reindex(columns=HEALTH_INPUT_COLUMNS)
+        return _health_score_batch(columns.to_numpy(dtype=np.float64, na_value=np.nan))
     
     def generate_risk_report(self, 
                            current_metrics: Dict,
                            prediction_score: float,
-                           historical_data: pd.DataFrame = None) -> Dict:
+                           historical_data: pd.DataFrame = None) -> RiskReport:
         """
         Generate comprehensive risk report
         """
@@ -263,26 +469,103 @@ class RiskScoringEngine:
         
         # Determine trend
         trend = 'stable'
-        if historical_data is not None and len(historical_data) > 24:
-            recent_health = [self.calculate_health_score(row.to_dict()) 
-                           for _, row in historical_data.tail(24).iterrows()]
-            if len(recent_health) >= 24:
-                if recent_health[-1] < recent_health[0] - 10:
-                    trend = 'degrading' if recent_health[-1] > 50 else 'critical'
-                elif recent_health[-1] > recent_health[0] + 10:
-                    trend = 'improving'
-        
-        failure_prob = self.calculate_failure_probability(
-            prediction_score, current_metrics, trend
+        if historical_data is not None and len(historical_data) > TREND_WINDOW:
+            # Least-squares slope over the window, scaled to the change across it;
+            # less noise-sensitive than comparing the two endpoints
+            recent_health = self.compute_health_series(historical_data.tail(TREND_WINDOW))
+            change = (_TREND_X @ recent_health) / _TREND_X_SS * (TREND_WINDOW - 1)
+            if change < -10:
+                trend = 'degrading' if recent_health[-1] > 50 else 'critical'
+            elif change > 10:
+                trend = 'improving'
+        
+        # One normalization pass shared by the fast-path check, the critical-zone
+        # adjustment and root cause identification
+        values = self._root_cause_values(current_metrics)
+        if not np.any((values - self._rc_warning) * self._rc_signs > 0):
+            # Common case: nothing past a warning threshold, so there are no root
+            # causes and (critical being stricter) no critical-zone adjustment
+            failure_prob = self._failure_probability(prediction_score, 0.0, trend, current_metrics)
+            root_causes = []
+        else:
+            adj_values = values[self._rc_adj_index]
+            in_critical = (adj_values - self._adj_thresholds) * self._adj_signs > 0
+            failure_prob = self._failure_probability(
+                prediction_score, float(in_critical @ self._adj_weights), trend, current_metrics
+            )
+            root_causes = self._root_causes(values.tolist())
+        
+        return RiskReport(
+            timestamp=_iso_second(int(time.time())),
+            health_score=health_score,
+            trend=trend,
+            failure_probability=failure_prob,
+            root_causes=root_causes,
+            metrics_snapshot=current_metrics
         )
+    
+    def generate_risk_reports_batch(self,
+                                    df: pd.DataFrame,
+                                    prediction_scores: np.ndarray) -> pd.DataFrame:
+        """
+        Risk reports for every row of a metrics frame, one row per report
         
-        root_causes = self.identify_root_causes(current_metrics, historical_data)
-        
-        return {
-            'timestamp': datetime.now().isoformat(),
-            'health_score': health_score,
+        Each row is scored as generate_risk_report would with the frame up to and
+        including it as historical data; NaN or absent columns count as missing metrics.
+        """
+        n = len(df)
+        prediction_scores = np.asarray(prediction_scores, dtype=float)
+        health = self.compute_health_series(df)
+        
+        # Trend: least-squares slope over each trailing window (needs > TREND_WINDOW rows)
+        trend = np.full(n, 'stable', dtype=object)
+        if n > TREND_WINDOW:
+            windows = sliding_window_view(health, TREND_WINDOW)[1:]
+            change = windows @ _TREND_X / _TREND_X_SS * (TREND_WINDOW - 1)
+            trend[TREND_WINDOW:] = np.where(
+                change < -10, np.where(windows[:, -1] > 50, 'degrading', 'critical'),
+                np.where(change > 10, 'improving', 'stable')
+            )
+        multiplier = np.array([self._TREND_MULTIPLIER[t] for t in trend], dtype=float)
+        
+        # Threshold checks on the (N, 7) root cause matrix, missing values at their defaults
+        raw = df.reindex(columns=list(self._rc_keys)).to_numpy(dtype=np.float64, na_value=np.nan)
+        values = np.where(np.isnan(raw), np.array(self._rc_defaults, dtype=float), raw)
+        warn_mask = (values - self._rc_warning) * self._rc_signs > 0
+        in_critical = (values[:, self._rc_adj_index] - self._adj_thresholds) * self._adj_signs > 0
+        
+        # Failure probability and confidence, vectorized
+        prob = np.clip(prediction_scores * multiplier + in_critical @ self._adj_weights, 0.0, 1.0)
+        expected = df.reindex(columns=sorted(self._EXPECTED_METRICS)).notna().to_numpy()
+        completeness = expected.sum(axis=1) / len(self._EXPECTED_METRICS)
+        drift = raw[:, self._rc_keys.index('data_drift_score')]
+        data_quality = np.where(np.isnan(drift), 1.0, 1 - np.minimum(drift, 1.0))
+        
+        # Root causes only for rows with something past a warning threshold
+        root_causes = [[] for _ in range(n)]
+        for i in np.flatnonzero(warn_mask.any(axis=1)):
+            root_causes[i] = self._root_causes(values[i].tolist())
+        
+        return pd.DataFrame({
+            'timestamp': _iso_second(int(time.time())),
+            'health_score': health,
             'trend': trend,
-            'failure_probability': failure_prob,
-            'root_causes': root_causes,
-            'metrics_snapshot': current_metrics
-        }
+            'failure_probability': prob * 100,
+            'failure_probability_24h': prob * 0.4 * 100,
+            'failure_probability_48h': prob * 0.7 * 100,
+            'failure_probability_72h': prob * 100,
+            'confidence': (completeness * 0.7 + data_quality * 0.3) * 100,
+            'root_causes': root_causes
+        }, index=df.index)
+    
+    def generate_risk_report_bytes(self,
+                                   current_metrics: Dict,
+                                   prediction_score: float,
+                                   historical_data: pd.DataFrame = None) -> bytes:
+        """
+        Generate a risk report already encoded as JSON bytes, for HTTP responses
+        """
+        report = self.generate_risk_report(current_metrics, prediction_score, historical_data)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(report.to_dict(), default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(report.to_dict(), default=_json_default).encode()